@@ -0,0 +1,54 @@
+"""Composite indexes for owner, soft-delete and ordering columns
+
+Revision ID: 5c1f0e8a9b7d
+Revises: fb34bd2800a0
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "5c1f0e8a9b7d"
+down_revision = "fb34bd2800a0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("entry", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_entry_owner_created",
+            ["user_id", "deleted_at", "created_at", "id"],
+            unique=False,
+        )
+
+    with op.batch_alter_table("tag", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_tag_owner_name", ["user_id", "deleted_at", "name"], unique=False
+        )
+
+    with op.batch_alter_table("shared_entry", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_shared_entry_user_id", ["user_id", "entry_id"], unique=False
+        )
+
+    with op.batch_alter_table("entry_tags", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_entry_tags_tag_id", ["tag_id", "entry_id"], unique=False
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("entry_tags", schema=None) as batch_op:
+        batch_op.drop_index("ix_entry_tags_tag_id")
+
+    with op.batch_alter_table("shared_entry", schema=None) as batch_op:
+        batch_op.drop_index("ix_shared_entry_user_id")
+
+    with op.batch_alter_table("tag", schema=None) as batch_op:
+        batch_op.drop_index("ix_tag_owner_name")
+
+    with op.batch_alter_table("entry", schema=None) as batch_op:
+        batch_op.drop_index("ix_entry_owner_created")
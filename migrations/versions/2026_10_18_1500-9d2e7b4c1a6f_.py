@@ -0,0 +1,35 @@
+"""Materialized live entry count on tag
+
+Revision ID: 9d2e7b4c1a6f
+Revises: 5c1f0e8a9b7d
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9d2e7b4c1a6f"
+down_revision = "5c1f0e8a9b7d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("tag", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("entry_count", sa.Integer(), server_default="0", nullable=False)
+        )
+
+    op.execute(
+        "UPDATE tag SET entry_count = ("
+        "SELECT count(*) FROM entry_tags JOIN entry ON entry.id = entry_tags.entry_id"
+        " WHERE entry_tags.tag_id = tag.id AND entry.deleted_at IS NULL)"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("tag", schema=None) as batch_op:
+        batch_op.drop_column("entry_count")
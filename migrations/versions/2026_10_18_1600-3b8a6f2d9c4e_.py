@@ -0,0 +1,111 @@
+"""Full text search index for entries
+
+Revision ID: 3b8a6f2d9c4e
+Revises: 9d2e7b4c1a6f
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+import base64
+import re
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3b8a6f2d9c4e"
+down_revision = "9d2e7b4c1a6f"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+_token = re.compile(r"[^\W_]+")
+
+entry = sa.table(
+    "entry",
+    sa.column("id", sa.Integer),
+    sa.column("_title", sa.String),
+    sa.column("_data", sa.Text),
+    sa.column("deleted_at", sa.DateTime),
+)
+
+
+def _decode(data):
+    return base64.b64decode(data).decode("UTF-8") if data else ""
+
+
+def upgrade():
+    op.create_table(
+        "entry_terms",
+        sa.Column("term", sa.String(length=64), nullable=False),
+        sa.Column("entry_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["entry_id"],
+            ["entry.id"],
+            name=op.f("fk_entry_terms_entry_id_entry"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("term", "entry_id", name=op.f("pk_entry_terms")),
+    )
+    with op.batch_alter_table("entry_terms", schema=None) as batch_op:
+        batch_op.create_index("ix_entry_terms_entry_id", ["entry_id"], unique=False)
+
+    fts = context.get_context().dialect.name == "sqlite"
+    if fts:
+        op.execute("CREATE VIRTUAL TABLE entry_fts USING fts5(title, content)")
+
+    if context.is_offline_mode():
+        return
+
+    # index existing entries in batches of ids
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(entry.c.id, entry.c._title, entry.c._data)
+            .where(entry.c.id > last_id, entry.c.deleted_at.is_(None))
+            .order_by(entry.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        # Row._data is reserved by sqlalchemy, unpack rows by position
+        docs = [(id_, _decode(title), _decode(data)) for id_, title, data in rows]
+        if fts:
+            bind.execute(
+                sa.text(
+                    "INSERT INTO entry_fts (rowid, title, content)"
+                    " VALUES (:id, :title, :content)"
+                ),
+                [
+                    {"id": id_, "title": title, "content": content}
+                    for id_, title, content in docs
+                ],
+            )
+            continue
+        terms = [
+            {"term": term, "entry_id": id_}
+            for id_, title, content in docs
+            for term in dict.fromkeys(
+                m[:64] for m in _token.findall(f"{title} {content}".lower())
+            )
+        ]
+        if terms:
+            bind.execute(
+                sa.text(
+                    "INSERT INTO entry_terms (term, entry_id) VALUES (:term, :entry_id)"
+                ),
+                terms,
+            )
+
+
+def downgrade():
+    if context.get_context().dialect.name == "sqlite":
+        op.execute("DROP TABLE IF EXISTS entry_fts")
+
+    with op.batch_alter_table("entry_terms", schema=None) as batch_op:
+        batch_op.drop_index("ix_entry_terms_entry_id")
+
+    op.drop_table("entry_terms")
@@ -0,0 +1,32 @@
+"""Storage format marker for entry text
+
+Revision ID: 7e4c2a9f1b3d
+Revises: 3b8a6f2d9c4e
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7e4c2a9f1b3d"
+down_revision = "3b8a6f2d9c4e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # existing rows keep the legacy base64 format until they are converted
+    with op.batch_alter_table("entry", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "storage", sa.String(length=8), server_default="base64", nullable=False
+            )
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("entry", schema=None) as batch_op:
+        batch_op.drop_column("storage")
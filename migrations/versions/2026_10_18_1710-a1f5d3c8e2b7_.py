@@ -0,0 +1,106 @@
+"""Convert base64 entry text to plain text
+
+Rows are converted in batches, each committed on its own so the table is
+never locked for long. Converted rows no longer match, so an interrupted
+upgrade resumes where it stopped when run again. Offline mode only changes
+the column default, unconverted rows are still read in the base64 format.
+
+Revision ID: a1f5d3c8e2b7
+Revises: 7e4c2a9f1b3d
+Create Date: 2026-10-18 17:10:00.000000
+
+"""
+
+import base64
+import zlib
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a1f5d3c8e2b7"
+down_revision = "7e4c2a9f1b3d"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+entry = sa.table(
+    "entry",
+    sa.column("id", sa.Integer),
+    sa.column("_title", sa.String),
+    sa.column("_data", sa.Text),
+    sa.column("storage", sa.String),
+)
+
+
+def _decode(value):
+    return base64.b64decode(value).decode("UTF-8") if value else value
+
+
+def _encode(value):
+    return base64.b64encode(value.encode("UTF-8")).decode("UTF-8") if value else value
+
+
+def _unzip(value):
+    return zlib.decompress(base64.b64decode(value)).decode("UTF-8") if value else value
+
+
+def _convert(from_storage, to_storage, title_fn, data_fn):
+    bind = op.get_bind()
+    stmt = (
+        sa.update(entry)
+        .where(entry.c.id == sa.bindparam("row_id"), entry.c.storage == from_storage)
+        .values(
+            _title=sa.bindparam("title"),
+            _data=sa.bindparam("data"),
+            storage=to_storage,
+        )
+    )
+    last_id = 0
+    while True:
+        with context.get_context().autocommit_block():
+            rows = bind.execute(
+                sa.select(entry.c.id, entry.c._title, entry.c._data)
+                .where(entry.c.id > last_id, entry.c.storage == from_storage)
+                .order_by(entry.c.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            bind.execute(
+                stmt,
+                [
+                    {"row_id": id_, "title": title_fn(title), "data": data_fn(data)}
+                    for id_, title, data in rows
+                ],
+            )
+
+
+def upgrade():
+    if not context.is_offline_mode():
+        _convert("base64", "text", _decode, _decode)
+
+    with op.batch_alter_table("entry", schema=None) as batch_op:
+        batch_op.alter_column(
+            "storage",
+            existing_type=sa.String(length=8),
+            server_default="text",
+            existing_nullable=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("entry", schema=None) as batch_op:
+        batch_op.alter_column(
+            "storage",
+            existing_type=sa.String(length=8),
+            server_default="base64",
+            existing_nullable=False,
+        )
+
+    if not context.is_offline_mode():
+        _convert("text", "base64", _encode, _encode)
+        _convert("zlib", "base64", _encode, lambda v: _encode(_unzip(v)))
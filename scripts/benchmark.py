@@ -0,0 +1,158 @@
+"""Micro benchmarks for query building and execution on a seeded sqlite db.
+
+Usage: python scripts/benchmark.py [name ...] [--users N] [--entries N] [-n N]
+"""
+
+import argparse
+import logging
+import timeit
+import typing as t
+from contextlib import contextmanager
+
+from flask import Flask, current_app, g
+from sqlalchemy import Select, insert, select
+
+from flask_journal.app import create_app
+from flask_journal.config import Config
+from flask_journal.models import Entry, User, db
+
+BENCHMARKS: dict[str, t.Callable[[argparse.Namespace], dict[str, t.Callable]]] = {}
+
+
+def benchmark(fn: t.Callable) -> t.Callable:
+    BENCHMARKS[fn.__name__] = fn
+    return fn
+
+
+def seed(users: int, entries: int) -> None:
+    """Insert `users` users with `entries` entries each, every entry shared
+    with the next 5 users."""
+    db.session.execute(
+        insert(User),
+        [
+            {"email": f"user{i}@example.test", "password": "", "fs_uniquifier": str(i)}
+            for i in range(users)
+        ],
+    )
+    ids: list[int] = list(db.session.scalars(select(User.id).order_by(User.id)))
+    db.session.execute(
+        insert(Entry),
+        [
+            {"_title": "", "_data": "", "user_id": u}
+            for u in ids
+            for _ in range(entries)
+        ],
+    )
+    db.session.execute(
+        insert(Entry._share_table),
+        [
+            {"entry_id": e, "user_id": ids[(i // entries + s) % len(ids)]}
+            for i, e in enumerate(db.session.scalars(select(Entry.id)))
+            for s in range(1, 6)
+        ],
+    )
+    db.session.commit()
+
+
+@contextmanager
+def logged_in(app: Flask) -> t.Iterator[User]:
+    with app.test_request_context():
+        g._login_user = db.session.scalar(select(User).limit(1))
+        yield g._login_user
+
+
+@benchmark
+def shared_select(args: argparse.Namespace) -> dict[str, t.Callable]:
+    from flask_journal.views.utils import build_select
+
+    user: User = g._login_user
+    old = select(Entry).where(Entry.shared_with.any(Entry.shared_with.contains(user)))
+    new = build_select(Entry, shared=True)
+    return {
+        "any": lambda: db.session.scalars(old).all(),
+        "semi-join": lambda: db.session.scalars(new).all(),
+    }
+
+
+@benchmark
+def soft_delete(args: argparse.Namespace) -> dict[str, t.Callable]:
+    """Per query overhead of hiding soft deleted rows, and a full query with each."""
+    from sqlalchemy_easy_softdelete.handler.rewriter import SoftDeleteQueryRewriter
+
+    from flask_journal.models import soft_delete_criteria
+    from flask_journal.views.utils import build_select
+
+    rewriter = SoftDeleteQueryRewriter("deleted_at", "include_deleted")
+    stmt = build_select(Entry, shared=None).limit(10)
+
+    def execute(stmt: Select) -> list:
+        return db.session.scalars(stmt.execution_options(include_deleted=True)).all()
+
+    return {
+        "rewrite": lambda: rewriter.rewrite_statement(stmt),
+        "criteria": lambda: stmt.options(*soft_delete_criteria),
+        "rewrite+execute": lambda: execute(rewriter.rewrite_statement(stmt)),
+        "criteria+execute": lambda: execute(stmt.options(*soft_delete_criteria)),
+    }
+
+
+@benchmark
+def requests(args: argparse.Namespace) -> dict[str, t.Callable]:
+    """Full requests of the entry views, and building their base statement."""
+    from flask_login import FlaskLoginClient
+
+    from flask_journal.views.utils import build_select
+
+    app: Flask = current_app._get_current_object()
+    user: User = g._login_user
+    entry_id = db.session.scalar(select(Entry.id).where(Entry.user_id == user.id))
+    app.test_client_class = FlaskLoginClient
+    client = app.test_client(user=user)
+
+    def get(url: str) -> None:
+        assert client.get(url).status_code == 200
+
+    return {
+        "build_select": lambda: build_select(Entry)._generate_cache_key(),
+        "/entries": lambda: get("/entries"),
+        "/entry?id=": lambda: get(f"/entry?id={entry_id}"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("names", nargs="*", help=", ".join(BENCHMARKS))
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--entries", type=int, default=50)
+    parser.add_argument("-n", "--number", type=int, default=20)
+    args = parser.parse_args()
+    for name in args.names:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark {name}")
+
+    app = create_app(
+        Config(
+            mapping={
+                "SQLALCHEMY_DATABASE_URI": "sqlite://",
+                "SQLALCHEMY_ECHO": False,
+                "TESTING": True,
+            }
+        )
+    )
+    # TESTING logs every statement, which would dominate the timings
+    logging.disable(logging.INFO)
+    with app.app_context():
+        seed(args.users, args.entries)
+        with logged_in(app):
+            for name in args.names or BENCHMARKS:
+                for label, fn in BENCHMARKS[name](args).items():
+                    best = min(timeit.repeat(fn, number=args.number, repeat=3))
+                    per_call = best / args.number
+                    print(
+                        f"{name:20} {label:20} {per_call * 1000:8.3f} ms"
+                        f" {1 / per_call:10.1f}/s"
+                    )
+
+
+if __name__ == "__main__":
+    main()
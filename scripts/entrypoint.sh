@@ -8,6 +8,11 @@ fi
 
 GUNICORN_CMD_ARGS="--chdir /app  --threads ${WORKER_THREADS}  --config gunicorn.config.py ${EXTRA_ARGS}"
 
+# Migrate and seed once, workers only check the schema revision when they boot
+JOURNAL_SCHEMA_STARTUP=skip flask journal migrate || exit 1
+JOURNAL_SCHEMA_STARTUP=skip flask journal seed || exit 1
+export JOURNAL_SCHEMA_STARTUP=check
+
 PROMETHEUS_MULTIPROC_DIR=${PROMETHEUS_MULTIPROC_DIR:-/prom}
 if [ -e ${PROMETHEUS_MULTIPROC_DIR} ]; then
     rm -rf ${PROMETHEUS_MULTIPROC_DIR}
@@ -1,4 +1,5 @@
 import os
+import time
 
 from flask import Flask
 from werkzeug.middleware.proxy_fix import ProxyFix
@@ -7,6 +8,7 @@ from .config import Config, init_config
 
 
 def create_app(c: Config | None = None) -> Flask:
+    start = time.perf_counter()
     app: Flask = Flask("flask_journal", root_path=os.getenv("FLASK_ROOT_PATH", None))
     init_config(app, c)
 
@@ -29,8 +31,17 @@ def create_app(c: Config | None = None) -> Flask:
     if app.config.get("IS_GUNICORN"):  # pragma: no cover
         app.wsgi_app = ProxyFix(app.wsgi_app, x_for=2, x_port=1, x_proto=1, x_host=1)
 
-    from .metrics import init_metrics
+    from .compress import init_compress
+
+    init_compress(app)
+
+    from .cli import init_cli
+
+    init_cli(app)
+
+    from .metrics import init_metrics, startup_seconds
 
     init_metrics(app)
+    startup_seconds.observe(time.perf_counter() - start)
 
     return app
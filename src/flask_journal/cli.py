@@ -0,0 +1,40 @@
+import logging
+
+import click
+from flask import Flask, current_app
+from flask.cli import AppGroup
+from flask_migrate import upgrade
+
+logger = logging.getLogger(__name__)
+
+journal = AppGroup("journal", help="Manage the journal database.")
+
+
+@journal.command("migrate")
+def migrate() -> None:
+    """Upgrade the database to the latest migration."""
+    upgrade()
+    click.echo("Database upgraded")
+
+
+@journal.command("seed")
+def seed() -> None:
+    """Create missing tables and the default roles."""
+    from .models.setup import init_data
+
+    init_data(current_app)
+    click.echo("Database seeded")
+
+
+@journal.command("precompress")
+@click.option("--min-size", default=500, show_default=True, help="Smallest file")
+def precompress(min_size: int) -> None:
+    """Write .gz and .br copies of the static files."""
+    from .compress import precompress as compress_folder
+
+    for path, _ in compress_folder(current_app.static_folder, min_size=min_size):
+        click.echo(path)
+
+
+def init_cli(app: Flask) -> None:
+    app.cli.add_command(journal)
@@ -0,0 +1,157 @@
+import gzip
+import logging
+import mimetypes
+import os
+import typing as t
+import zlib
+
+from flask import Flask, current_app, request, send_from_directory
+from werkzeug import Response as werkzeugResponse
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Suffixes of precompressed static files by content coding, in preference order
+PRECOMPRESSED = {"br": ".br", "gzip": ".gz"}
+
+
+def available_encodings() -> list[str]:
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate(encodings: t.Iterable[str]) -> str | None:
+    """Best content coding of `encodings` accepted by the request."""
+    return request.accept_encodings.best_match(list(encodings))
+
+
+class Compressor:
+    """Incremental gzip or brotli compressor."""
+
+    def __init__(self: t.Self, encoding: str, level: int) -> None:
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=min(level, 11))
+            self._flush = self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(
+                level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+            )
+            self._flush = self._compressor.flush
+
+    def compress(self: t.Self, data: bytes) -> bytes:
+        if hasattr(self._compressor, "process"):
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def finish(self: t.Self) -> bytes:
+        return self._flush()
+
+    def stream(self: t.Self, chunks: t.Iterable[bytes]) -> t.Iterator[bytes]:
+        for chunk in chunks:
+            if data := self.compress(chunk):
+                yield data
+        yield self.finish()
+
+
+def _compressible(response: werkzeugResponse) -> bool:
+    return (
+        response.status_code == 200
+        and "Content-Encoding" not in response.headers
+        and not response.direct_passthrough
+        and response.mimetype in current_app.config.get("COMPRESS_MIMETYPES", [])
+        and "no-transform" not in response.headers.get("Cache-Control", "")
+    )
+
+
+def compress_response(response: werkzeugResponse) -> werkzeugResponse:
+    """Compress `response` with the best coding accepted by the client.
+
+    Buffered responses shorter than `COMPRESS_MIN_SIZE` are sent as is,
+    streamed responses are compressed chunk by chunk.
+    """
+    if not _compressible(response):
+        return response
+    response.vary.add("Accept-Encoding")
+    encoding = negotiate(available_encodings())
+    if encoding is None or request.method == "HEAD":
+        return response
+
+    level: int = current_app.config.get("COMPRESS_LEVEL", 6)
+    compressor = Compressor(encoding, level)
+    if response.is_streamed:
+        response.response = compressor.stream(response.response)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < current_app.config.get("COMPRESS_MIN_SIZE", 500):
+            return response
+        response.set_data(compressor.compress(data) + compressor.finish())
+
+    response.content_encoding = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def send_static_file(filename: str) -> werkzeugResponse:
+    """Static files, using a precompressed copy when the client accepts it."""
+    static_folder: str = current_app.static_folder
+    encoding = negotiate(PRECOMPRESSED)
+    if encoding is not None and os.path.isfile(
+        os.path.join(static_folder, filename + PRECOMPRESSED[encoding])
+    ):
+        response = send_from_directory(
+            static_folder,
+            filename + PRECOMPRESSED[encoding],
+            mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+        )
+        response.content_encoding = encoding
+    else:
+        response = current_app.send_static_file(filename)
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def precompress(
+    folder: str, min_size: int = 500, level: int = 9
+) -> t.Iterator[tuple[str, str]]:
+    """Write `.gz` (and `.br` with brotli) copies of the files in `folder`.
+
+    Args:
+        folder (str): directory to compress recursively
+        min_size (int): files smaller than this are skipped
+        level (int): compression level
+
+    Yields:
+        tuple[str, str]: path of each written file and its source
+    """
+    suffixes = tuple(PRECOMPRESSED.values())
+    for root, _, files in os.walk(folder):
+        for name in files:
+            path = os.path.join(root, name)
+            if name.endswith(suffixes) or os.path.getsize(path) < min_size:
+                continue
+            with open(path, "rb") as f:
+                data = f.read()
+            outputs = {".gz": gzip.compress(data, compresslevel=level, mtime=0)}
+            if brotli is not None:
+                outputs[".br"] = brotli.compress(data, quality=11)
+            for suffix, compressed in outputs.items():
+                if len(compressed) >= len(data):
+                    continue
+                with open(path + suffix, "wb") as f:
+                    f.write(compressed)
+                yield path + suffix, path
+
+
+def init_compress(app: Flask) -> None:
+    if not app.config.get("COMPRESS_RESPONSES"):
+        return
+    app.after_request(compress_response)
+    if app.has_static_folder:
+        app.view_functions["static"] = send_static_file
+    logger.debug("compressing responses with %s", available_encodings())
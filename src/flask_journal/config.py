@@ -16,6 +16,15 @@ class DefaultConfig(object):
 
     # SQLALCHEMY
     # "SQLALCHEMY_DATABASE_URI": "sqlite://", ChangeMe
+    SQLALCHEMY_REPLICAS: list[str] = []  # Read only copies used by GET requests
+    REPLICA_READ_YOUR_WRITES = 5  # Seconds a user reads the primary after a commit
+    # Schema work done by create_app: "upgrade" migrates and seeds, "check" only
+    # verifies the revision (run `flask journal migrate/seed` first), "skip"
+    SCHEMA_STARTUP = "upgrade"
+    WORKER_THREADS = 1  # Threads per worker, one pooled connection each
+    DB_POOL_OVERFLOW = None  # Extra connections beyond the pool, default threads
+    DB_POOL_PRE_PING = True
+    DB_POOL_RECYCLE = 1800  # Seconds before a pooled connection is replaced
 
     # MAIL
     MAIL_DEFAULT_SENDER = "journal@localhost"  # ChangeMe
@@ -87,6 +96,34 @@ class DefaultConfig(object):
 
     SECURITY_TRACKABLE = "True"
 
+    # JOURNAL
+    KEYSET_PAGINATION = False  # Use after/before cursors instead of page numbers
+    MAX_PAGE_SIZE = 100
+    COUNT_CACHE_TTL = 60  # Seconds a table total is reused, 0 disables the cache
+    COUNT_CACHE_SIZE = 1024
+    COUNT_ESTIMATE_THRESHOLD = None  # Stop counting table totals after this many
+    SETTINGS_CACHE_TTL = 60  # Seconds user settings are reused, 0 disables
+    SETTINGS_CACHE_SIZE = 1024
+    MATERIALIZED_TAG_COUNTS = False  # Read tag cloud counts from Tag.entry_count
+    FRAGMENT_CACHE_BACKEND = "memory"  # memory, filesystem or "module:Class"
+    FRAGMENT_CACHE_TTL = 300  # Seconds a rendered fragment is reused, 0 disables
+    FRAGMENT_CACHE_SIZE = 1024  # Fragments kept by the memory backend
+    FRAGMENT_CACHE_DIR = None  # Filesystem backend directory, default in instance
+    OFFLINE_ASSETS = False  # Serve Bootstrap and themes locally, not from the CDN
+    COMPRESS_RESPONSES = (
+        False  # gzip, and brotli if installed, for clients accepting it
+    )
+    COMPRESS_MIN_SIZE = 500  # Bytes, smaller buffered responses are sent as is
+    COMPRESS_LEVEL = 6
+    COMPRESS_MIMETYPES = [
+        "text/html",
+        "text/css",
+        "text/javascript",
+        "application/javascript",
+        "application/json",
+    ]
+    ENTRY_COMPRESS_THRESHOLD = None  # Compress entry bodies longer than this
+
 
 class Config(DefaultConfig):
     def __init__(
@@ -94,6 +131,7 @@ class Config(DefaultConfig):
     ) -> None:
         super().__init__()
         self.IS_GUNICORN = bool(os.getenv("IS_GUNICORN", False))
+        self.WORKER_THREADS = int(os.getenv("WORKER_THREADS", self.WORKER_THREADS))
         if mapping:
             self._load_mapping(mapping)
         self._load_mapping(kwargs)
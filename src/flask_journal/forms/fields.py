@@ -3,14 +3,13 @@ import typing as t
 
 from flask_login import current_user
 from flask_wtf import FlaskForm
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
 from wtforms import DateTimeField, FormField, SelectFieldBase, StringField, widgets
 from wtforms.validators import ValidationError
 
 from ..models import Tag, User, UserSettings, db
 from ..models.base import JournalBaseModel
-from .widgets import PlainTextWidget
+from ..models.tag import find_or_create_tags
+from .widgets import PlainTextWidget, TypeaheadSelect
 
 logger = logging.getLogger(__name__)
 
@@ -49,19 +48,9 @@ class DisplayStringField(StringField):
 class TagField(StringField):
     def process_formdata(self: t.Self, valuelist: list[str]) -> None:
         if valuelist:
-            self.data: list[Tag] = []
-            for tag in valuelist[0].split(" "):
-                if tag.strip() == "":
-                    continue
-                obj = db.session.scalar(
-                    select(Tag)
-                    .filter_by(name=tag, user=current_user)
-                    .options(joinedload(Tag.entries))
-                )
-
-                if not obj:
-                    obj = Tag(user=current_user, name=tag)
-                self.data.append(obj)
+            self.data: list[Tag] = find_or_create_tags(
+                db.session, current_user.id, valuelist[0].split()
+            )
 
     def _value(self: t.Self) -> str:
         return (
@@ -126,22 +115,23 @@ class ModelSelectField(SelectFieldBase):
 
 
 class ModelSelectMultipleField(ModelSelectField):
-    widget = widgets.Select(multiple=True)
+    """Select of many instances of `model`.
+
+    Only the selected instances are rendered, others are searched through the
+    typeahead endpoint, so the model table is never read in full.
+    """
+
+    widget = TypeaheadSelect()
 
     def iter_choices(
         self: t.Self,
     ) -> t.Generator[tuple[str, str, bool, dict], None, None]:
-        instances = db.session.scalars(select(self.model))
-        for instance in instances:
-            if instance not in self.excludes:
-                yield (
-                    instance.id,
-                    str(instance),
-                    self.data is not None and instance in self.data,
-                    dict(),
-                )
+        for instance in self.data or []:
+            if isinstance(instance, self.model):
+                yield (instance.id, str(instance), True, dict())
 
     def process_data(self: t.Self, value: t.Any) -> None:
+        self.unknown: list[int] = []
         self.data = (
             [instance for instance in value if isinstance(instance, self.model)]
             if value
@@ -153,15 +143,18 @@ class ModelSelectMultipleField(ModelSelectField):
             self.data = []
             return
         try:
-            self.data = [self.model.find_by_id(value) for value in valuelist]
+            ids = [int(value) for value in valuelist]
         except ValueError as exc:
             raise ValueError(self.gettext("Invalid Choice: could not coerce.")) from exc
+        self.data = self.model.find_by_ids(ids)
+        self.unknown = [id for id, obj in zip(ids, self.data) if obj is None]
 
     def pre_validate(self: t.Self, form: FlaskForm) -> None:
         if self.data is None:
             return
-        acceptable = {c[0] for c in self.iter_choices()}
-        if any(
-            not (isinstance(d, self.model) and d.id in acceptable) for d in self.data
-        ):
+        if self.unknown:
+            raise ValidationError(
+                "Invalid Value(s): %s" % ", ".join(str(id) for id in self.unknown)
+            )
+        if any(not isinstance(d, self.model) or d in self.excludes for d in self.data):
             raise ValidationError("Invalid Value(s)")
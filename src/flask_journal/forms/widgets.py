@@ -1,7 +1,9 @@
 import typing as t
 
+from flask import url_for
 from markupsafe import Markup
 from wtforms import Field
+from wtforms.widgets import Select
 from wtforms.widgets.core import html_params
 
 
@@ -27,3 +29,35 @@ class PlainTextWidget:
         return Markup(
             "<input %s readonly>" % self.html_params(name=field.name, **kwargs)
         )
+
+
+class TypeaheadSelect(Select):
+    """Multiple select of the selected options only, with a search box.
+
+    Other options are suggested by `static/js/typeahead.js` from the JSON
+    endpoint `journal.choices` for the field model.
+    """
+
+    def __init__(self: t.Self) -> None:
+        super().__init__(multiple=True)
+
+    def __call__(self: t.Self, field: Field, **kwargs: t.Any) -> str:
+        kwargs.setdefault("id", field.id)
+        kwargs["data-typeahead"] = url_for(
+            "journal.choices", name=field.model.__tablename__
+        )
+        select = super().__call__(field, **kwargs)
+        if kwargs.get("readonly"):
+            return select
+
+        search = html_params(
+            id=f"{kwargs['id']}-search",
+            type="search",
+            list=f"{kwargs['id']}-options",
+            placeholder="Search",
+            autocomplete="off",
+            class_="form-control mt-1",
+        )
+        return Markup(
+            f'{select}<input {search}><datalist id="{kwargs["id"]}-options"></datalist>'
+        )
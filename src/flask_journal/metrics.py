@@ -1,9 +1,15 @@
 import logging
 import os
+import time
+import typing as t
+import weakref
 
 from flask import Flask
+from prometheus_client import Gauge, Histogram
 from prometheus_flask_exporter import PrometheusMetrics
 from prometheus_flask_exporter.multiprocess import GunicornInternalPrometheusMetrics
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
 
 from . import __version__ as APP_VERSION
 
@@ -22,5 +28,85 @@ except ValueError:  # pragma: no cover
     logger.debug("Skipping app_info metric duplicate")
 
 
+startup_seconds = Histogram(
+    "journal_startup_seconds",
+    "Time spent creating the app in a worker",
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+query_seconds = Histogram(
+    "journal_db_query_seconds", "Database statement duration by bind", ["bind"]
+)
+pool_checked_out = Gauge(
+    "journal_db_pool_checked_out",
+    "Connections checked out of the pool",
+    ["bind"],
+    multiprocess_mode="livesum",
+)
+pool_overflow = Gauge(
+    "journal_db_pool_overflow",
+    "Connections opened beyond the pool size",
+    ["bind"],
+    multiprocess_mode="livesum",
+)
+pool_wait_seconds = Histogram(
+    "journal_db_pool_wait_seconds", "Time waited for a pooled connection", ["bind"]
+)
+_bind_names: weakref.WeakKeyDictionary[Engine, str] = weakref.WeakKeyDictionary()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """Queue pool exporting its usage and checkout waits as bind `bind_name`."""
+
+    bind_name = "unknown"
+
+    def recreate(self: t.Self) -> QueuePool:
+        pool = super().recreate()
+        pool.bind_name = self.bind_name
+        return pool
+
+    def _do_get(self: t.Self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        record = super()._do_get()
+        pool_wait_seconds.labels(self.bind_name).observe(time.perf_counter() - start)
+        self._observe()
+        return record
+
+    def _do_return_conn(self: t.Self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        self._observe()
+
+    def _observe(self: t.Self) -> None:
+        pool_checked_out.labels(self.bind_name).set(self.checkedout())
+        pool_overflow.labels(self.bind_name).set(max(self.overflow(), 0))
+
+
+def _before_execute(conn: Connection, *args: t.Any) -> None:
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_execute(conn: Connection, *args: t.Any) -> None:
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    query_seconds.labels(_bind_names.get(conn.engine, "unknown")).observe(elapsed)
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """Observe statement durations and pool usage of `engine` as bind `name`."""
+    if engine in _bind_names:
+        return
+    _bind_names[engine] = name
+    event.listen(engine, "before_cursor_execute", _before_execute)
+    event.listen(engine, "after_cursor_execute", _after_execute)
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.bind_name = name
+
+
 def init_metrics(app: Flask) -> None:
+    from .models import db
+    from .models.routing import replica_engines
+
     metrics.init_app(app)
+    with app.app_context():
+        for key, engine in db.engines.items():
+            instrument_engine(engine, key or "default")
+    for name, engine in replica_engines(app).items():
+        instrument_engine(engine, name)
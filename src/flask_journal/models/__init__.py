@@ -1,49 +1,132 @@
+import logging
+
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
 from flask import Flask
 from flask_migrate import Migrate, upgrade
-from sqlalchemy.event import listens_for
-from sqlalchemy.orm import ORMExecuteState, Session
-from sqlalchemy_easy_softdelete.handler.rewriter import SoftDeleteQueryRewriter
+from sqlalchemy import event, make_url
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+from sqlalchemy.orm.interfaces import ORMOption
 from sqlalchemy_easy_softdelete.hook import IgnoredTable
 
 from .db import db
-from .entry import Entry  # noqa: F401
+from .entry import (  # noqa: F401
+    Entry,
+    collect_tag_counts,
+    touch_entries,
+    update_tag_counts,
+)
 from .rbac import Role  # noqa: F401
+from .routing import init_replicas
+from .search import include_object, update_search_index
 from .setup import init_data
 from .tag import Tag  # noqa: F401
 from .user import User, UserSettings  # noqa: F401
 
-migrate = Migrate()
+logger = logging.getLogger(__name__)
+
+migrate = Migrate(include_object=include_object)
 
 
 def init_db(app: Flask) -> None:
+    init_pool(app)
     db.init_app(app)
+    init_replicas(app)
     init_soft_delete()
+    init_tag_counts()
+    init_search()
     migrate.init_app(app, db)
+    startup: str = app.config.get("SCHEMA_STARTUP", "upgrade")
+    if startup == "upgrade":
+        with app.app_context():
+            upgrade()
+        init_data(app)
+    elif startup == "check":
+        check_schema(app)
+
+
+def check_schema(app: Flask) -> None:
+    """Fail fast if the database is not at the latest migration.
+
+    Raises:
+        RuntimeError: the database revision differs from the migration heads
+    """
     with app.app_context():
-        upgrade()
-    init_data(app)
+        script = ScriptDirectory.from_config(migrate.get_config())
+        with db.engine.connect() as conn:
+            current = set(MigrationContext.configure(conn).get_current_heads())
+    heads = set(script.get_heads())
+    if current != heads:
+        raise RuntimeError(
+            "database revision %s is not %s, run `flask journal migrate`"
+            % (sorted(current), sorted(heads))
+        )
+    logger.debug("database revision %s", sorted(current))
+
+
+def init_pool(app: Flask) -> None:
+    """Size the connection pools after the number of threads of a worker.
+
+    Every thread holds at most one connection per bind, so `WORKER_THREADS`
+    connections never wait. Options set in `SQLALCHEMY_ENGINE_OPTIONS` win.
+    """
+    from ..metrics import InstrumentedQueuePool
+
+    options: dict = app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", {})
+    options.setdefault("pool_pre_ping", app.config.get("DB_POOL_PRE_PING", True))
+    options.setdefault("pool_recycle", app.config.get("DB_POOL_RECYCLE", -1))
+
+    url = make_url(app.config.get("SQLALCHEMY_DATABASE_URI") or "sqlite://")
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return  # a single shared connection, not a sized pool
+
+    threads: int = app.config.get("WORKER_THREADS", 1)
+    overflow: int | None = app.config.get("DB_POOL_OVERFLOW")
+    options.setdefault("poolclass", InstrumentedQueuePool)
+    options.setdefault("pool_size", threads)
+    options.setdefault("max_overflow", threads if overflow is None else overflow)
+    logger.debug("database pool options %s", options)
+
+
+# Criteria hiding soft deleted rows, one option per soft deletable mapper
+soft_delete_criteria: tuple[ORMOption, ...] = ()
 
 
 def init_soft_delete() -> None:
-    global global_rewriter
-    global_rewriter = SoftDeleteQueryRewriter(
-        deleted_field_name="deleted_at",
-        disable_soft_delete_option_name="include_deleted",
-        ignored_tables=[
-            table
-            for table in db.metadata.tables.values()
-            if isinstance(table, IgnoredTable)
-        ],
+    global soft_delete_criteria
+    soft_delete_criteria = tuple(
+        with_loader_criteria(
+            mapper.class_, mapper.class_.deleted_at.is_(None), include_aliases=True
+        )
+        for mapper in db.Model.registry.mappers
+        if "deleted_at" in mapper.columns
+        and not isinstance(mapper.local_table, IgnoredTable)
     )
+    if not event.contains(Session, "do_orm_execute", soft_delete_execute):
+        event.listen(Session, "do_orm_execute", soft_delete_execute)
+
+
+def soft_delete_execute(state: ORMExecuteState) -> None:
+    """Hide soft deleted rows from every ORM select, relationship loads included.
+
+    The criteria are built once, adding them to a statement is cheap and keeps
+    the compiled statement cache effective, unlike rewriting the statement.
+    """
+    if not state.is_select or state.execution_options.get("include_deleted", False):
+        return
+    state.statement = state.statement.options(*soft_delete_criteria)
+
 
-    # Enable Soft Delete on all Relationship Loads
-    @listens_for(Session, identifier="do_orm_execute")
-    def soft_delete_execute(state: ORMExecuteState) -> None:
-        if not state.is_select:
-            return
+def init_tag_counts() -> None:
+    for identifier, fn in [
+        ("before_flush", touch_entries),
+        ("before_flush", collect_tag_counts),
+        ("after_flush_postexec", update_tag_counts),
+    ]:
+        if not event.contains(Session, identifier, fn):
+            event.listen(Session, identifier, fn)
 
-        # Rewrite the statement
-        adapted = global_rewriter.rewrite_statement(state.statement)
 
-        # Replace the statement
-        state.statement = adapted
+def init_search() -> None:
+    if not event.contains(Session, "after_flush", update_search_index):
+        event.listen(Session, "after_flush", update_search_index)
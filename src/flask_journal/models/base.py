@@ -1,12 +1,14 @@
 import logging
 import typing as t
 from datetime import UTC, datetime
+from functools import cache
 
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import DateTime, Integer, select, sql
+from sqlalchemy import DateTime, Integer, Select, bindparam, inspect, select, sql
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.schema import MetaData
 
 logger = logging.getLogger(__name__)
@@ -36,6 +38,8 @@ class JournalBaseModel(DeclarativeBase):
 
     ownable: bool = False
     shareable: bool = False
+    # Attributes needed to read non column fields, ie hybrid properties
+    loader_fields: t.ClassVar[dict[str, tuple[str, ...]]] = {}
 
     @hybrid_property
     def active(self: t.Self) -> bool:
@@ -54,15 +58,42 @@ class JournalBaseModel(DeclarativeBase):
     def find_by_id(cls: t.Self, id: int) -> t.Self:
         return cls.__fsa__.session.get(cls, id)
 
+    @classmethod
+    def find_by_ids(cls: t.Self, ids: t.Iterable[int]) -> list[t.Self | None]:
+        """Instances with the primary keys `ids`, in the same order.
+
+        Instances already loaded in the session are reused, the others are
+        loaded with a single query.
+
+        Args:
+            ids (t.Iterable[int]): primary keys, may repeat
+
+        Returns:
+            list[t.Self | None]: instance of each id, None for unknown ids
+        """
+        session = cls.__fsa__.session
+        ids = list(ids)
+        found: dict[int, t.Self] = {}
+        for id in set(ids):
+            obj = session.identity_map.get(identity_key(cls, id))
+            if obj is not None and not inspect(obj).expired:
+                found[id] = obj
+        if missing := [id for id in set(ids) if id not in found]:
+            found.update(
+                (obj.id, obj)
+                for obj in session.scalars(select(cls).where(cls.id.in_(missing)))
+            )
+        return [found.get(id) for id in ids]
+
     @classmethod
     def find_by_attr(
         cls: t.Self, attr: str | InstrumentedAttribute, value: t.Any
     ) -> t.Self:
-        if not isinstance(attr, InstrumentedAttribute):
-            if not hasattr(cls, attr):
-                raise AttributeError(cls, attr)
-            attr = getattr(cls, attr)
-        return cls.__fsa__.session.scalar(select(cls).where(attr == value))
+        if isinstance(attr, InstrumentedAttribute):
+            attr = attr.key
+        elif not hasattr(cls, attr):
+            raise AttributeError(cls, attr)
+        return cls.__fsa__.session.scalar(_select_by(cls, attr), {"value": value})
 
     def delete(self: t.Self) -> None:
         if self.deleted_at:
@@ -80,3 +111,9 @@ class JournalBaseModel(DeclarativeBase):
 
     def __str__(self: t.Self) -> str:
         return f"{self.__class__.__name__}: {self.id}"
+
+
+@cache
+def _select_by(model: type[JournalBaseModel], attr: str) -> Select:
+    """Select `model` by `attr`, built once with the value as a parameter."""
+    return select(model).where(getattr(model, attr) == bindparam("value"))
@@ -1,6 +1,9 @@
 from flask_sqlalchemy import SQLAlchemy
 
 from .base import JournalBaseModel
+from .routing import RoutingSession
 
 # create the extension
-db = SQLAlchemy(model_class=JournalBaseModel)  # type: ignore
+db = SQLAlchemy(
+    model_class=JournalBaseModel, session_options={"class_": RoutingSession}
+)  # type: ignore
@@ -1,45 +1,246 @@
 import base64
 import typing as t
+import zlib
+from enum import StrEnum
 
-from sqlalchemy import String, Text
+from flask import current_app, has_app_context
+from sqlalchemy import (
+    ColumnElement,
+    Index,
+    String,
+    Text,
+    case,
+    func,
+    inspect,
+    select,
+    update,
+)
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import (
+    Mapped,
+    Session,
+    UOWTransaction,
+    column_property,
+    mapped_column,
+    relationship,
+)
 
 from .db import db
 from .mixin import ShareableMixin
-from .tag import Tag
+from .tag import EntryTags, Tag
+
+
+class StorageFormat(StrEnum):
+    """Storage formats of `Entry` text.
+
+    `base64` is the legacy format of both columns, otherwise the title is plain
+    text and the format applies to the body. `zlib` bodies are compressed and
+    base64 encoded to fit the text column.
+    """
+
+    base64 = "base64"
+    text = "text"
+    zlib = "zlib"
+
+
+def decode_data(data: str | None, storage: str | None) -> str:
+    """Decode text stored in `storage` format.
+
+    Args:
+        data (str | None): stored value
+        storage (str | None): storage format, None or empty for plain text
+
+    Returns:
+        str: decoded text
+    """
+    if not data:
+        return ""
+    match storage:
+        case StorageFormat.base64:
+            return base64.b64decode(data).decode("UTF-8")
+        case StorageFormat.zlib:
+            return zlib.decompress(base64.b64decode(data)).decode("UTF-8")
+    return data
+
+
+def encode_data(value: str) -> tuple[str, StorageFormat]:
+    """Encode an entry body, compressing it above `ENTRY_COMPRESS_THRESHOLD`.
+
+    Args:
+        value (str): body text
+
+    Returns:
+        tuple[str, StorageFormat]: value to store and its storage format
+    """
+    threshold: int | None = (
+        current_app.config.get("ENTRY_COMPRESS_THRESHOLD")
+        if has_app_context()
+        else None
+    )
+    if threshold is not None and len(value) > threshold:
+        compressed = base64.b64encode(zlib.compress(value.encode("UTF-8")))
+        if len(compressed) < len(value):
+            return compressed.decode("ascii"), StorageFormat.zlib
+    return value, StorageFormat.text
 
 
 class Entry(db.Model, ShareableMixin):
+    __table_args__ = (
+        Index("ix_entry_owner_created", "user_id", "deleted_at", "created_at", "id"),
+    )
+
     _title: Mapped[str] = mapped_column(String(255))
     _data: Mapped[str] = mapped_column(Text, default="")
+    # Format of _title and _data, see `StorageFormat`
+    storage: Mapped[str] = mapped_column(
+        String(8), default="text", server_default="text"
+    )
 
     tags: Mapped[list[Tag]] = relationship(
         secondary="entry_tags", back_populates="entries"
     )
 
+    loader_fields = {
+        "title": ("_title", "storage"),
+        "content": ("_data", "storage"),
+        "shared": ("shared_with",),
+    }
+
     @hybrid_property
     def content(self: t.Self) -> str:
-        return self._decode_data(self._data)
+        return decode_data(self._data, self.storage)
+
+    @content.inplace.expression
+    @classmethod
+    def _content_expression(cls: t.Self) -> ColumnElement[str]:
+        # only bodies stored as plain text can be used in SQL
+        return case((cls.storage == StorageFormat.text, cls._data))
 
     @content.inplace.setter
     def _content_setter(self: t.Self, value: str) -> None:
-        self._data = self._encode_data(value)
+        self._upgrade_storage()
+        self._data, self.storage = encode_data(value)
 
     @hybrid_property
     def title(self: t.Self) -> str:
-        return self._decode_data(self._title)
+        return decode_data(self._title, StorageFormat.base64 if self._legacy else None)
+
+    @title.inplace.expression
+    @classmethod
+    def _title_expression(cls: t.Self) -> ColumnElement[str]:
+        return case((cls.storage != StorageFormat.base64, cls._title))
 
     @title.inplace.setter
     def _title_setter(self: t.Self, value: str) -> None:
-        self._title = self._encode_data(value)
+        self._upgrade_storage()
+        self._title = value
+
+    @property
+    def _legacy(self: t.Self) -> bool:
+        return self.storage == StorageFormat.base64
+
+    def _upgrade_storage(self: t.Self) -> None:
+        # Convert both columns at once, the format marker applies to the row
+        if self.storage is None:
+            self.storage = StorageFormat.text
+        elif self._legacy:
+            self._title = decode_data(self._title, StorageFormat.base64)
+            self._data, self.storage = encode_data(
+                decode_data(self._data, StorageFormat.base64)
+            )
+
+
+# Space separated names of the entry tags, aggregated in SQL. Deferred, so it is
+# only selected when listed, ie. as a table view column.
+Entry.tag_names = column_property(
+    select(func.coalesce(func.aggregate_strings(Tag.name, " "), ""))
+    .select_from(EntryTags)
+    .join(Tag, Tag.id == EntryTags.c.tag_id)
+    .where(EntryTags.c.entry_id == Entry.id)
+    .correlate_except(EntryTags, Tag)
+    .scalar_subquery(),
+    deferred=True,
+)
+
+
+def touch_entries(
+    session: Session, flush_context: UOWTransaction, instances: t.Any
+) -> None:
+    """Bump `updated_at` of entries whose tags or shares change.
 
-    def _decode_data(self: t.Self, data: str | bytes = None) -> str:
-        if not data:
-            return ""
-        b: bytes = base64.b64decode(data)
-        return b.decode("UTF-8")
+    Entries using a renamed or (un)deleted tag are bumped too, so `updated_at`
+    changes whenever a rendered entry or entry list would.
+    """
+    tag_ids: list[int] = []
+    for obj in session.dirty:
+        attrs = inspect(obj).attrs
+        if isinstance(obj, Entry) and (
+            attrs.tags.history.has_changes() or attrs.shared_with.history.has_changes()
+        ):
+            obj.updated_at = func.now()
+        elif isinstance(obj, Tag) and (
+            attrs.name.history.has_changes() or attrs.deleted_at.history.has_changes()
+        ):
+            tag_ids.append(obj.id)
 
-    def _encode_data(self: t.Self, value: str) -> str:
-        b: bytes = value.encode("UTF-8")
-        return base64.b64encode(b).decode("UTF-8")
+    if tag_ids:
+        entry = Entry.__table__
+        session.connection().execute(
+            update(entry)
+            .where(
+                entry.c.id.in_(
+                    select(EntryTags.c.entry_id).where(EntryTags.c.tag_id.in_(tag_ids))
+                )
+            )
+            .values(updated_at=func.now())
+        )
+
+
+def collect_tag_counts(
+    session: Session, flush_context: UOWTransaction, instances: t.Any
+) -> None:
+    """Collect tags whose live entry count may change with this flush."""
+    tags: set[Tag | int] = session.info.setdefault("tag_counts", set())
+    entry_ids: list[int] = []
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, Entry):
+            continue
+        state = inspect(obj)
+        history = state.attrs.tags.history
+        tags.update(history.added, history.deleted)
+        if obj.id is not None and (
+            obj in session.deleted or state.attrs.deleted_at.history.has_changes()
+        ):
+            entry_ids.append(obj.id)
+
+    if entry_ids:
+        tags.update(
+            session.connection().scalars(
+                select(EntryTags.c.tag_id).where(EntryTags.c.entry_id.in_(entry_ids))
+            )
+        )
+
+
+def update_tag_counts(session: Session, flush_context: UOWTransaction) -> None:
+    """Recount `Tag.entry_count` for the tags collected by `collect_tag_counts`."""
+    tag_ids: set[int] = {
+        tag if isinstance(tag, int) else tag.id
+        for tag in session.info.pop("tag_counts", set())
+    }
+    if not tag_ids:
+        return
+
+    tag = Tag.__table__
+    entry = Entry.__table__
+    count = (
+        select(func.count())
+        .select_from(EntryTags.join(entry, entry.c.id == EntryTags.c.entry_id))
+        .where(EntryTags.c.tag_id == tag.c.id, entry.c.deleted_at.is_(None))
+        .scalar_subquery()
+    )
+    session.connection().execute(
+        update(tag).where(tag.c.id.in_(tag_ids)).values(entry_count=count)
+    )
+    for obj in session.identity_map.values():
+        if isinstance(obj, Tag) and obj.id in tag_ids:
+            session.expire(obj, ["entry_count"])
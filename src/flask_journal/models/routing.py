@@ -0,0 +1,86 @@
+import logging
+import random
+import time
+import typing as t
+
+from flask import Flask, current_app, has_request_context, request, session
+from flask_sqlalchemy.session import Session as FlaskSession
+from sqlalchemy import Connection, Engine, Select, create_engine, event
+from sqlalchemy.orm import Session, UOWTransaction
+
+logger = logging.getLogger(__name__)
+
+REPLICAS_KEY = "journal_replicas"
+# Flask session key holding the time of the user's last commit
+LAST_WRITE_KEY = "_journal_last_write"
+_WROTE = "replica_wrote"
+_READ_METHODS = ("GET", "HEAD")
+
+
+def replica_engines(app: Flask) -> dict[str, Engine]:
+    """Engines of the `SQLALCHEMY_REPLICAS` of `app`, by bind name."""
+    return app.extensions.get(REPLICAS_KEY, {})
+
+
+def init_replicas(app: Flask) -> None:
+    """Create engines for `SQLALCHEMY_REPLICAS`, named `replica_<n>`."""
+    options: dict[str, t.Any] = app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {})
+    app.extensions[REPLICAS_KEY] = {
+        f"replica_{i}": create_engine(url, **options)
+        for i, url in enumerate(app.config.get("SQLALCHEMY_REPLICAS") or [])
+    }
+    if app.extensions[REPLICAS_KEY]:
+        logger.info("reading from replicas %s", list(app.extensions[REPLICAS_KEY]))
+    for identifier, fn in [
+        ("after_flush", _track_write),
+        ("after_commit", _record_write),
+        ("after_rollback", _discard_write),
+    ]:
+        if not event.contains(Session, identifier, fn):
+            event.listen(Session, identifier, fn)
+
+
+def _recent_write() -> bool:
+    window: float = current_app.config.get("REPLICA_READ_YOUR_WRITES", 0)
+    return time.time() - session.get(LAST_WRITE_KEY, 0) < window
+
+
+class RoutingSession(FlaskSession):
+    """Session sending reads of GET requests to a replica.
+
+    Statements go to the primary when the request may write, once the session
+    has flushed in the current transaction, and for a short time after the
+    user committed so they always read their own writes.
+    """
+
+    def get_bind(
+        self: t.Self,
+        mapper: t.Any | None = None,
+        clause: t.Any | None = None,
+        bind: Engine | Connection | None = None,
+        **kwargs: t.Any,
+    ) -> Engine | Connection:
+        if (
+            bind is None
+            and isinstance(clause, Select)
+            and has_request_context()
+            and request.method in _READ_METHODS
+            and not self.info.get(_WROTE)
+            and (replicas := replica_engines(current_app))
+            and not _recent_write()
+        ):
+            return random.choice(list(replicas.values()))
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _track_write(session: Session, flush_context: UOWTransaction) -> None:
+    session.info[_WROTE] = True
+
+
+def _record_write(db_session: Session) -> None:
+    if db_session.info.pop(_WROTE, False) and has_request_context():
+        session[LAST_WRITE_KEY] = time.time()
+
+
+def _discard_write(db_session: Session) -> None:
+    db_session.info.pop(_WROTE, None)
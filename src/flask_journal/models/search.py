@@ -0,0 +1,179 @@
+import logging
+import re
+import typing as t
+
+from sqlalchemy import (
+    DDL,
+    Column,
+    Connection,
+    Engine,
+    ForeignKey,
+    Index,
+    Integer,
+    Select,
+    String,
+    Table,
+    column,
+    delete,
+    event,
+    insert,
+    inspect,
+    select,
+    table,
+)
+from sqlalchemy.orm import Session, UOWTransaction
+
+from .db import db
+from .entry import Entry
+
+logger = logging.getLogger(__name__)
+
+TERM_LENGTH = 64
+_token = re.compile(r"[^\W_]+")
+
+# Portable inverted index, used when the database has no full text search
+EntryTerms = Table(
+    "entry_terms",
+    db.metadata,
+    Column("term", String(TERM_LENGTH), primary_key=True),
+    Column(
+        "entry_id",
+        Integer(),
+        ForeignKey("entry.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Index("ix_entry_terms_entry_id", "entry_id"),
+)
+
+# SQLite FTS5 index, rowid is the entry id
+EntryFTS = table("entry_fts", column("rowid"), column("title"), column("content"))
+
+event.listen(
+    db.metadata,
+    "after_create",
+    DDL(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS entry_fts USING fts5(title, content)"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    db.metadata,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS entry_fts").execute_if(dialect="sqlite"),
+)
+
+
+def include_object(
+    obj: t.Any, name: str, type_: str, reflected: bool, compare_to: t.Any
+) -> bool:
+    """Hide the FTS5 table and its shadow tables from alembic autogenerate."""
+    return not (type_ == "table" and reflected and name.startswith("entry_fts"))
+
+
+def use_fts(bind: Connection | Engine) -> bool:
+    return bind.dialect.name == "sqlite"
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower cased, unique terms of `text` in order of appearance.
+
+    Args:
+        text (str): text to split
+
+    Returns:
+        list[str]: terms, truncated to the length of an index term
+    """
+    return list(dict.fromkeys(m[:TERM_LENGTH] for m in _token.findall(text.lower())))
+
+
+def match(bind: Connection | Engine, query: str) -> Select:
+    """Select ids of entries containing every term of `query` as a prefix.
+
+    Args:
+        bind (Connection | Engine): bind the statement is built for
+        query (str): search text entered by the user
+
+    Returns:
+        Select: entry ids, empty if `query` has no terms
+    """
+    terms = tokenize(query)
+    if use_fts(bind):
+        stmt = select(EntryFTS.c.rowid)
+        if not terms:
+            return stmt.where(False)
+        return stmt.where(
+            column("entry_fts").match(" ".join(f'"{term}"*' for term in terms))
+        )
+
+    stmt = select(Entry.id)
+    if not terms:
+        return stmt.where(False)
+    for term in terms:
+        stmt = stmt.where(
+            Entry.id.in_(
+                select(EntryTerms.c.entry_id).where(
+                    EntryTerms.c.term.startswith(term, autoescape=True)
+                )
+            )
+        )
+    return stmt
+
+
+def reindex(
+    connection: Connection, entries: t.Iterable[Entry], removed: t.Iterable[int] = ()
+) -> None:
+    """Replace the indexed text of `entries` and drop `removed` from the index.
+
+    Args:
+        connection (Connection): connection to write the index with
+        entries (t.Iterable[Entry]): live entries to index
+        removed (t.Iterable[int]): ids of entries to remove from the index
+    """
+    entries = list(entries)
+    ids = [entry.id for entry in entries] + list(removed)
+    if not ids:
+        return
+
+    logger.debug("reindex entries %s", ids)
+    if use_fts(connection):
+        connection.execute(delete(EntryFTS).where(EntryFTS.c.rowid.in_(ids)))
+        if entries:
+            connection.execute(
+                insert(EntryFTS),
+                [
+                    {"rowid": e.id, "title": e.title, "content": e.content}
+                    for e in entries
+                ],
+            )
+        return
+
+    connection.execute(delete(EntryTerms).where(EntryTerms.c.entry_id.in_(ids)))
+    rows = [
+        {"term": term, "entry_id": e.id}
+        for e in entries
+        for term in tokenize(f"{e.title} {e.content}")
+    ]
+    if rows:
+        connection.execute(insert(EntryTerms), rows)
+
+
+def _search_changed(entry: Entry) -> bool:
+    state = inspect(entry)
+    return any(
+        state.attrs[name].history.has_changes()
+        for name in ("_title", "_data", "deleted_at")
+    )
+
+
+def update_search_index(session: Session, flush_context: UOWTransaction) -> None:
+    """Keep the search index in step with entries written by this flush."""
+    entries: list[Entry] = []
+    removed: list[int] = [obj.id for obj in session.deleted if isinstance(obj, Entry)]
+    for obj in (*session.new, *session.dirty):
+        if not isinstance(obj, Entry):
+            continue
+        if obj in session.new or _search_changed(obj):
+            if obj.deleted_at is None:
+                entries.append(obj)
+            else:
+                removed.append(obj.id)
+    reindex(session.connection(), entries, removed)
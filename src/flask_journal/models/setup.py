@@ -1,6 +1,7 @@
 import logging
 
 from flask import Flask
+from sqlalchemy import select
 
 from .db import db
 from .rbac import Role
@@ -16,11 +17,19 @@ logger = logging.getLogger(__name__)
 
 def init_roles(app: Flask) -> None:
     with app.app_context():
+        existing = set(
+            db.session.scalars(
+                select(Role.name)
+                .where(Role.name.in_(roles))
+                .execution_options(include_deleted=True)
+            )
+        )
         for name, role in roles.items():
-            if Role.find_by_name(name) is None:
+            if name not in existing:
                 logger.info(f"Created new role: {name}")
                 db.session.add(Role(name=name, **role))
-        db.session.commit()
+        if db.session.new:
+            db.session.commit()
 
 
 def init_data(app: Flask) -> None:
@@ -1,18 +1,41 @@
+import logging
 import typing as t
 
-from sqlalchemy import Column, ForeignKey, Integer, String, Table, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Index,
+    Insert,
+    Integer,
+    String,
+    Table,
+    UniqueConstraint,
+    insert,
+    select,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from .db import db
 from .mixin import OwnableMixin
 
+if t.TYPE_CHECKING:
+    Entry = db.Model
+
+logger = logging.getLogger(__name__)
+
 
 class Tag(db.Model, OwnableMixin):
-    __table_args__ = (UniqueConstraint("name", "user_id"),)
+    __table_args__ = (
+        UniqueConstraint("name", "user_id"),
+        Index("ix_tag_owner_name", "user_id", "deleted_at", "name"),
+    )
 
     name: Mapped[str] = mapped_column(String(64))
+    # Live entries using the tag, kept up to date by `entry.update_tag_counts`
+    entry_count: Mapped[int] = mapped_column(default=0, server_default="0")
 
-    entries: Mapped[list] = relationship(
+    entries: Mapped[list["Entry"]] = relationship(
         "Entry", secondary="entry_tags", back_populates="tags"
     )
 
@@ -28,4 +51,61 @@ EntryTags = Table(
     db.metadata,
     Column("entry_id", Integer(), ForeignKey("entry.id"), primary_key=True),
     Column("tag_id", Integer(), ForeignKey("tag.id"), primary_key=True),
+    Index("ix_entry_tags_tag_id", "tag_id", "entry_id"),
 )
+
+
+def _insert_missing(session: Session) -> Insert:
+    """Insert of tags skipping rows that already exist, ie. created concurrently."""
+    match session.get_bind().dialect.name:
+        case "sqlite":
+            return sqlite.insert(Tag).on_conflict_do_nothing()
+        case "postgresql":
+            return postgresql.insert(Tag).on_conflict_do_nothing()
+        case "mysql" | "mariadb":
+            return insert(Tag).prefix_with("IGNORE")
+    return insert(Tag)
+
+
+def find_or_create_tags(
+    session: Session, user_id: int, names: t.Iterable[str]
+) -> list[Tag]:
+    """Tags of user `user_id` named `names`, creating the missing ones.
+
+    Existing tags are found with a single query, missing tags are created with
+    a single insert and read back. Soft deleted tags are restored, as their
+    names are still taken. Entries of the tags are not loaded.
+
+    Args:
+        session (Session): session the tags are loaded into
+        user_id (int): owner of the tags
+        names (t.Iterable[str]): tag names, duplicates are ignored
+
+    Returns:
+        list[Tag]: tags in the order of `names`
+    """
+    names = list(dict.fromkeys(names))
+    if not names:
+        return []
+
+    def select_tags(names: list[str]) -> dict[str, Tag]:
+        stmt = (
+            select(Tag)
+            .where(Tag.user_id == user_id, Tag.name.in_(names))
+            .execution_options(include_deleted=True)
+        )
+        return {tag.name: tag for tag in session.scalars(stmt)}
+
+    tags = select_tags(names)
+    if missing := [name for name in names if name not in tags]:
+        logger.debug("create tags %s", missing)
+        session.execute(
+            _insert_missing(session),
+            [{"name": name, "user_id": user_id} for name in missing],
+        )
+        tags.update(select_tags(missing))
+
+    for tag in tags.values():
+        if tag.deleted_at is not None:
+            tag.undelete()
+    return [tags[name] for name in names]
@@ -1,9 +1,10 @@
 import typing as t
 import uuid
 from datetime import datetime
+from functools import cached_property
 
 from flask_security.core import UserMixin
-from sqlalchemy import DateTime, Enum, ForeignKey, String
+from sqlalchemy import DateTime, Enum, ForeignKey, String, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy_easy_softdelete.hook import IgnoredTable
 
@@ -46,6 +47,18 @@ class User(db.Model, UserMixin):
     def __str__(self: t.Self) -> str:
         return self.name if self.name else self.email
 
+    @cached_property
+    def role_names(self: t.Self) -> frozenset[str]:
+        """Names of the roles of the user, resolved once per loaded instance.
+
+        The user is loaded once per request, with its roles, so permission
+        checks are set lookups. Changing `roles` clears the cached names.
+        """
+        return frozenset(role.name for role in self.roles or ())
+
+    def has_role(self: t.Self, role: "str | Role") -> bool:
+        return (role if isinstance(role, str) else role.name) in self.role_names
+
     @property
     def immutable_attrs(self: t.Self) -> list[str]:
         return ["tracking"] + super().immutable_attrs
@@ -55,6 +68,13 @@ class User(db.Model, UserMixin):
         return self
 
 
+@event.listens_for(User.roles, "append")
+@event.listens_for(User.roles, "remove")
+@event.listens_for(User.roles, "bulk_replace")
+def _clear_role_names(target: User, *args: t.Any) -> None:
+    target.__dict__.pop("role_names", None)
+
+
 class UserSettings(db.Model, IgnoredTable):
     user_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
 
@@ -1,11 +1,12 @@
 from flask import Flask
 from flask_mailman import Mail
-from flask_security import Security, SQLAlchemyUserDatastore
+from flask_security import Security
 from flask_security.utils import config_value as security_config_value
 from flask_wtf import CSRFProtect
 
 from ..models import Role, User, db
 from . import utils
+from .datastore import JournalUserDatastore
 from .signals import init_signals
 
 security = Security()
@@ -21,7 +22,7 @@ def init_security_context_processors() -> None:
 def init_security(app: Flask) -> None:
     CSRFProtect(app)
     Mail(app)
-    security.init_app(app, SQLAlchemyUserDatastore(db, User, Role))
+    security.init_app(app, JournalUserDatastore(db, User, Role))
     init_signals(app)
     init_security_context_processors()
     utils.PASSWORD_LENGTH = security_config_value("PASSWORD_LENGTH_MIN", app=app)
@@ -0,0 +1,33 @@
+import typing as t
+
+from flask_security import SQLAlchemyUserDatastore
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload
+
+from ..models import User
+
+
+class JournalUserDatastore(SQLAlchemyUserDatastore):
+    def find_user(
+        self: t.Self, case_insensitive: bool = False, **kwargs: t.Any
+    ) -> User | None:
+        """Find a user, including inactive (soft deleted) users.
+
+        Flask-Security has to find inactive users to tell them their account
+        is disabled, so the soft delete criteria are not applied.
+        """
+        stmt = (
+            select(self.user_model)
+            .options(joinedload(self.user_model.roles))
+            .execution_options(include_deleted=True)
+        )
+        if case_insensitive:
+            if len(kwargs) > 1:
+                raise ValueError("Case insensitive option only supports single key")
+            attr, identifier = kwargs.popitem()
+            stmt = stmt.where(
+                func.lower(getattr(self.user_model, attr)) == func.lower(identifier)
+            )
+        else:
+            stmt = stmt.filter_by(**kwargs)
+        return self.db.session.scalars(stmt).unique().first()
@@ -1,9 +1,16 @@
 import secrets
 
-from flask_security import hash_password
+from flask_security import current_user, hash_password
+from sqlalchemy import Integer, bindparam
 
 PASSWORD_LENGTH: int = 8  # This will be overwritten by SECURITY_PASSWORD_LENGTH_MIN
 
+# Id of the logged in user, resolved each time a statement using it is executed
+# so statements can be built once and shared by all requests
+current_user_id = bindparam(
+    "current_user_id", type_=Integer(), callable_=lambda: current_user.id
+)
+
 
 def get_random_pw_hash() -> str:
     return hash_password(secrets.token_urlsafe(PASSWORD_LENGTH))
@@ -0,0 +1,40 @@
+// Options of selects rendered by TypeaheadSelect are searched as the user
+// types, picking a suggestion adds it to the selected options.
+document.querySelectorAll("select[data-typeahead]").forEach((select) => {
+    const input = document.getElementById(select.id + "-search");
+    const suggestions = document.getElementById(select.id + "-options");
+    if (!input || !suggestions) {
+        return;
+    }
+    let timer = null;
+
+    input.addEventListener("input", () => {
+        const picked = [...suggestions.options].find((o) => o.value === input.value);
+        if (picked) {
+            let option = [...select.options].find((o) => o.value === picked.dataset.id);
+            if (!option) {
+                option = new Option(picked.value, picked.dataset.id);
+                select.add(option);
+            }
+            option.selected = true;
+            input.value = "";
+            return;
+        }
+
+        clearTimeout(timer);
+        timer = setTimeout(async () => {
+            const url = new URL(select.dataset.typeahead, window.location.href);
+            url.searchParams.set("q", input.value);
+            const response = await fetch(url, {headers: {"Accept": "application/json"}});
+            if (!response.ok) {
+                return;
+            }
+            const data = await response.json();
+            suggestions.replaceChildren(...data.results.map((result) => {
+                const option = new Option(result.text);
+                option.dataset.id = result.id;
+                return option;
+            }));
+        }, 200);
+    });
+});
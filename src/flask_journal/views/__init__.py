@@ -15,10 +15,20 @@ logger = logging.getLogger(__name__)
 
 
 def init_views(app: Flask) -> None:
-    from . import admin, entry, home, settings, tag  # noqa: F401
-
+    from . import admin, choices, entry, home, search, settings, tag  # noqa: F401
+    from . import api
+    from .assets import init_assets
+    from .counts import init_counts
+    from .fragments import init_fragments
+    from .user_settings import init_settings_cache
+
+    init_counts()
+    init_settings_cache()
     app.register_blueprint(bp)
+    app.register_blueprint(api.bp)
     bootstrap.init_app(app)
+    init_assets(app)
+    init_fragments(app)
 
 
 @bp.route("/")
@@ -0,0 +1,199 @@
+import logging
+import typing as t
+from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
+
+from flask import Blueprint, abort, current_app, jsonify, request, url_for
+from flask_login import current_user
+from sqlalchemy import Select
+from sqlalchemy.orm import selectinload
+from werkzeug.exceptions import HTTPException
+
+from ..models import Entry, Tag, User, db
+from ..models.base import JournalBaseModel
+from . import etag, utils, werkzeugResponse
+from .pagination import KeysetPagination
+
+logger = logging.getLogger(__name__)
+
+bp = Blueprint("api", __name__, url_prefix="/api/v1")
+
+
+@dataclass(frozen=True)
+class Resource:
+    """Model exposed by the API and how its rows are listed and serialized.
+
+    `fields` maps each field name to a function reading it from an instance,
+    the names are also the attributes passed to `utils.loader_options`.
+    """
+
+    model: type[JournalBaseModel]
+    fields: dict[str, t.Callable[[t.Any], t.Any]]
+    order_field: str = "created_at"
+    descending: bool = False
+    loaders: dict[str, utils.Loader] | None = None
+
+
+TIMESTAMPS = ("created_at", "updated_at", "deleted_at")
+
+ENTRIES = Resource(
+    Entry,
+    fields={
+        "id": attrgetter("id"),
+        "title": attrgetter("title"),
+        "content": attrgetter("content"),
+        "user_id": attrgetter("user_id"),
+        "tags": lambda entry: [tag.name for tag in entry.tags],
+        "shared_with": lambda entry: [user.id for user in entry.shared_with],
+        **{name: attrgetter(name) for name in TIMESTAMPS},
+    },
+    descending=True,
+    loaders={
+        "tags": lambda attr: selectinload(attr).load_only(Tag.id, Tag.name),
+        "shared_with": lambda attr: selectinload(attr).load_only(User.id),
+    },
+)
+
+TAGS = Resource(
+    Tag,
+    fields={
+        "id": attrgetter("id"),
+        "name": attrgetter("name"),
+        "entry_count": attrgetter("entry_count"),
+        **{name: attrgetter(name) for name in TIMESTAMPS},
+    },
+    order_field="name",
+)
+
+
+def _user_key() -> tuple:
+    """Parts of the user changing a response, only deleted rows depend on roles."""
+    return (current_user.id, sorted(current_user.role_names))
+
+
+@bp.before_request
+def authenticate() -> None:
+    # Users are loaded from the session or an `Authentication-Token` header,
+    # clients get a 401 instead of the redirect to the login page
+    if not current_user.is_authenticated:
+        abort(401)
+
+
+@bp.errorhandler(HTTPException)
+def handle_exception(e: HTTPException) -> tuple[werkzeugResponse, int]:
+    return jsonify(error=e.name, message=e.description), e.code
+
+
+def _value(value: t.Any) -> t.Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def requested_fields(resource: Resource) -> list[str]:
+    """Fields selected by the `fields` argument, all fields if it is missing.
+
+    Args:
+        resource (Resource): resource being read
+
+    Returns:
+        list[str]: field names in the order of `resource.fields`
+    """
+    if not (arg := request.args.get("fields", "").strip()):
+        return list(resource.fields)
+    names = {name.strip() for name in arg.split(",")}
+    if unknown := names - resource.fields.keys():
+        abort(400, "unknown fields: %s" % ", ".join(sorted(unknown)))
+    return [name for name in resource.fields if name in names]
+
+
+def serialize(
+    resource: Resource, obj: JournalBaseModel, fields: list[str]
+) -> dict[str, t.Any]:
+    return {name: _value(resource.fields[name](obj)) for name in fields}
+
+
+def _select(resource: Resource, fields: list[str], stmt: Select) -> Select:
+    """`stmt` loading only what is needed for `fields` and the cursor."""
+    names = fields + [resource.order_field, "id"]
+    if options := utils.loader_options(resource.model, names, resource.loaders):
+        stmt = stmt.options(*options)
+    return stmt
+
+
+def list_view(resource: Resource, shared: bool | None = None) -> werkzeugResponse:
+    """Page of the rows of `resource` visible to the user, newest first for
+    entries.
+
+    Pages are located with the `after` and `before` cursors of
+    `KeysetPagination`, `limit` sets the page size.
+    """
+    fields = requested_fields(resource)
+    limit: int = request.args.get("limit", 20, type=int)
+    if not 0 < limit <= current_app.config.get("MAX_PAGE_SIZE", 100):
+        abort(400, "limit out of range: %d" % limit)
+
+    stmt = utils.build_select(resource.model, shared=shared)
+    try:
+        pagination = KeysetPagination(
+            db.session,
+            _select(resource, fields, stmt),
+            model=resource.model,
+            order_field=resource.order_field,
+            descending=resource.descending,
+            per_page=limit,
+            after=request.args.get("after"),
+            before=request.args.get("before"),
+        )
+    except ValueError as exc:
+        abort(400, str(exc))
+
+    def page_url(**cursor: str | None) -> str | None:
+        if None in cursor.values():
+            return None
+        args = request.args.to_dict() | {"after": None, "before": None} | cursor
+        return url_for(request.endpoint, _external=True, **args)
+
+    return jsonify(
+        items=[serialize(resource, obj, fields) for obj in pagination.items],
+        next=page_url(after=pagination.next_cursor),
+        prev=page_url(before=pagination.prev_cursor),
+    )
+
+
+def record_view(resource: Resource, id: int) -> werkzeugResponse:
+    fields = requested_fields(resource)
+    stmt = utils.build_select(resource.model, filters=dict(id=id))
+    obj = db.session.scalar(_select(resource, fields, stmt))
+    if obj is None:
+        abort(404)
+    return jsonify(serialize(resource, obj, fields))
+
+
+@bp.route("/entries")
+@etag.conditional(etag.collection(Entry, shared=False), user_key=_user_key)
+def entries() -> werkzeugResponse:
+    return list_view(ENTRIES, shared=False)
+
+
+@bp.route("/entries/shared")
+@etag.conditional(etag.collection(Entry, shared=True), user_key=_user_key)
+def shared_entries() -> werkzeugResponse:
+    return list_view(ENTRIES, shared=True)
+
+
+@bp.route("/entries/<int:id>")
+@etag.conditional(etag.record(Entry), user_key=_user_key)
+def entry(id: int) -> werkzeugResponse:
+    return record_view(ENTRIES, id)
+
+
+@bp.route("/tags")
+@etag.conditional(etag.collection(Tag), user_key=_user_key)
+def tags() -> werkzeugResponse:
+    return list_view(TAGS)
+
+
+@bp.route("/tags/<int:id>")
+@etag.conditional(etag.record(Tag), user_key=_user_key)
+def tag(id: int) -> werkzeugResponse:
+    return record_view(TAGS, id)
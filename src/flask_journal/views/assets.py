@@ -0,0 +1,92 @@
+import hashlib
+import logging
+import os
+import re
+import typing as t
+from functools import cache
+
+from flask import Flask, current_app, g, send_from_directory
+from werkzeug import Response as werkzeugResponse
+
+logger = logging.getLogger(__name__)
+
+# Endpoint of the Bootstrap and Bootswatch files shipped with Bootstrap-Flask
+ASSET_ENDPOINT = "bootstrap.static"
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+_fingerprinted = re.compile(r"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{12})(?P<ext>\.[^./]+)$")
+
+
+@cache
+def content_hash(path: str) -> str:
+    """Short hash of the content of the file at `path`, read once per process."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+def fingerprint(folder: str, filename: str) -> str:
+    """`filename` with the hash of its content before the extension.
+
+    Args:
+        folder (str): directory `filename` is relative to
+        filename (str): file to fingerprint, e.g. `css/bootstrap.min.css`
+
+    Returns:
+        str: e.g. `css/bootstrap.min.0123456789ab.css`, unchanged if missing
+    """
+    try:
+        digest = content_hash(os.path.join(folder, filename))
+    except OSError:
+        return filename
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.{digest}{ext}"
+
+
+def _asset_folder() -> str:
+    return current_app.blueprints["bootstrap"].static_folder
+
+
+def fingerprint_url(endpoint: str, values: dict[str, t.Any]) -> None:
+    """Build asset urls with fingerprinted filenames."""
+    if endpoint == ASSET_ENDPOINT and "filename" in values:
+        values["filename"] = fingerprint(_asset_folder(), values["filename"])
+
+
+def send_asset(filename: str) -> werkzeugResponse:
+    """Serve an asset, forever cacheable if requested by its fingerprint."""
+    folder = _asset_folder()
+    match = _fingerprinted.match(filename)
+    if match is None:
+        return send_from_directory(folder, filename)
+
+    filename = match["stem"] + match["ext"]
+    if fingerprint(folder, filename) != match[0]:
+        # Page rendered before the asset changed, send the current content
+        return send_from_directory(folder, filename)
+    response = send_from_directory(folder, filename, max_age=IMMUTABLE_MAX_AGE)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+def preload(url: str, kind: str) -> None:
+    """Announce `url` in a `Link: rel=preload` header of the current response."""
+    g.setdefault("preload", {})[url] = kind
+
+
+def add_preload_headers(response: werkzeugResponse) -> werkzeugResponse:
+    for url, kind in g.pop("preload", {}).items():
+        response.headers.add("Link", f"<{url}>; rel=preload; as={kind}")
+    return response
+
+
+def init_assets(app: Flask) -> None:
+    app.after_request(add_preload_headers)
+    if not app.config.get("OFFLINE_ASSETS"):
+        return
+    app.config["BOOTSTRAP_SERVE_LOCAL"] = True
+    app.url_defaults(fingerprint_url)
+    app.view_functions[ASSET_ENDPOINT] = send_asset
+    logger.debug(
+        "serving fingerprinted assets from %s",
+        app.blueprints["bootstrap"].static_folder,
+    )
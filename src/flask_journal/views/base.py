@@ -1,7 +1,15 @@
 import logging
 import typing as t
 
-from flask import abort, flash, redirect, render_template, request, url_for
+from flask import (
+    abort,
+    current_app,
+    flash,
+    redirect,
+    render_template,
+    request,
+    url_for,
+)
 from flask_login import current_user
 from flask_sqlalchemy.pagination import Pagination
 from sqlalchemy import Select
@@ -11,7 +19,8 @@ from sqlalchemy.sql import ColumnExpressionArgument, desc
 from ..forms import CustomForm
 from ..models import db
 from ..models.base import JournalBaseModel
-from . import utils, werkzeugResponse
+from . import counts, utils, werkzeugResponse
+from .pagination import KeysetPagination
 
 logger = logging.getLogger(__name__)
 
@@ -125,20 +134,62 @@ def table_view(
     descending: bool = False,
     endpoint: str = "",
     shared: bool | None = None,
+    keyset: bool | None = None,
+    where: ColumnExpressionArgument | None = None,
+    loaders: dict[str, utils.Loader] | None = None,
 ) -> werkzeugResponse | str:
-    page = request.args.get("page", 1, type=int)
-    page_size = request.args.get("page_size", 10, type=int)
+    page_size = min(
+        request.args.get("page_size", 10, type=int),
+        current_app.config.get("MAX_PAGE_SIZE", 100),
+    )
+    if keyset is None:
+        keyset = current_app.config.get("KEYSET_PAGINATION", False)
 
     select: Select = utils.build_select(model=model, shared=shared)
+    if where is not None:
+        select = select.where(where)
+    if titles:
+        fields = [title[0] for title in titles] + [order_field, "id"]
+        if options := utils.loader_options(model, fields, loaders):
+            select = select.options(*options)
 
-    if order_field and hasattr(model, order_field):
-        order_attr: QueryableAttribute = getattr(model, order_field)
-        order_exp: ColumnExpressionArgument = (
-            desc(order_attr) if descending else order_attr
-        )
-        select: Select = select.order_by(order_exp)
+    if keyset:
+        if page_size < 1:
+            abort(404)
+        try:
+            pagination = KeysetPagination(
+                db.session,
+                select,
+                model=model,
+                order_field=order_field,
+                descending=descending,
+                per_page=page_size,
+                after=request.args.get("after", None),
+                before=request.args.get("before", None),
+            )
+        except ValueError as exc:
+            logger.debug(exc)
+            abort(400)
+    else:
+        page = request.args.get("page", 1, type=int)
+        if order_field and hasattr(model, order_field):
+            order_attr: QueryableAttribute = getattr(model, order_field)
+            order_exp: ColumnExpressionArgument = (
+                desc(order_attr) if descending else order_attr
+            )
+            select: Select = select.order_by(order_exp)
 
-    pagination: Pagination = db.paginate(select, page=page, per_page=page_size)
+        pagination: Pagination = db.paginate(
+            select, page=page, per_page=page_size, count=False
+        )
+        counts.set_total(
+            pagination,
+            db.session,
+            select,
+            model=model,
+            shared=shared,
+            cache=where is None,
+        )
     return render_template(
         "journal/tablebase.html",
         pagination=pagination,
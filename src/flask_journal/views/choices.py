@@ -0,0 +1,59 @@
+import logging
+
+from flask import abort, current_app, jsonify, request
+from flask_login import current_user, login_required
+from sqlalchemy import Select, or_, select
+from sqlalchemy.orm import load_only
+
+from ..models import Role, User, db
+from . import bp, werkzeugResponse
+
+logger = logging.getLogger(__name__)
+
+# Models offered by `ModelSelectMultipleField`, by table name: the model, the
+# role needed to list it and the columns searched and shown
+CHOICES = {
+    "user": (User, None, (User.email, User.name)),
+    "role": (Role, "admin", (Role.name,)),
+}
+
+
+@bp.route("/api/choices/<name>")
+@login_required
+def choices(name: str) -> werkzeugResponse:
+    """Page of instances matching the `q` prefix, for typeahead selects."""
+    if name not in CHOICES:
+        abort(404)
+    model, role, columns = CHOICES[name]
+    if role is not None and not current_user.has_role(role):
+        abort(403)
+
+    query: str = request.args.get("q", "").strip()
+    page: int = max(request.args.get("page", 1, type=int), 1)
+    limit: int = min(
+        max(request.args.get("limit", 20, type=int), 1),
+        current_app.config.get("MAX_PAGE_SIZE", 100),
+    )
+    stmt: Select = (
+        select(model)
+        .options(load_only(*columns))
+        .order_by(columns[0], model.id)
+        .offset((page - 1) * limit)
+        .limit(limit + 1)
+    )
+    if query:
+        stmt = stmt.where(
+            or_(*(column.istartswith(query, autoescape=True) for column in columns))
+        )
+    if model is User:
+        stmt = stmt.where(User.id != current_user.id)
+
+    instances = list(db.session.scalars(stmt))
+    logger.debug("%d %s choices for %r", len(instances), name, query)
+    return jsonify(
+        results=[
+            {"id": instance.id, "text": str(instance)} for instance in instances[:limit]
+        ],
+        page=page,
+        more=len(instances) > limit,
+    )
@@ -0,0 +1,140 @@
+import logging
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from itertools import chain
+
+from flask import current_app
+from flask_login import current_user
+from flask_sqlalchemy.pagination import Pagination
+from sqlalchemy import Select, event, func, select
+from sqlalchemy.orm import Session, UOWTransaction, scoped_session
+
+from ..models import db
+from ..models.base import JournalBaseModel
+
+logger = logging.getLogger(__name__)
+
+# Per process state, other workers only see commits once COUNT_CACHE_TTL expires
+_versions: dict[str, int] = {}
+_cache: OrderedDict[tuple, tuple[float, int]] = OrderedDict()
+_lock = threading.Lock()
+
+
+def cache_key(
+    model: JournalBaseModel, shared: bool | None, include_deleted: bool
+) -> tuple:
+    """Key of a cached total, changes whenever rows of `model` are committed."""
+    return (
+        model.__name__,
+        _versions.get(model.__name__, 0),
+        getattr(current_user, "id", None),
+        shared,
+        include_deleted,
+    )
+
+
+def count_total(
+    session: scoped_session,
+    stmt: Select,
+    model: JournalBaseModel,
+    shared: bool | None = None,
+    cache: bool = True,
+) -> int:
+    """Count the rows selected by `stmt`, reusing cached totals when possible.
+
+    If `COUNT_ESTIMATE_THRESHOLD` is set the count stops after that many rows,
+    so a result above the threshold only means "at least this many".
+
+    Args:
+        session (scoped_session): session used to run the count
+        stmt (Select): statement built by `build_select`
+        model (JournalBaseModel): model selected by `stmt`
+        shared (bool | None): shared flag passed to `build_select`
+        cache (bool): cache the total, only valid for unfiltered statements
+
+    Returns:
+        int: total number of rows
+    """
+    options: dict[str, t.Any] = dict(stmt.get_execution_options())
+    key = cache_key(model, shared, bool(options.get("include_deleted", False)))
+    ttl: float = current_app.config.get("COUNT_CACHE_TTL", 0) if cache else 0
+
+    with _lock:
+        cached = _cache.get(key)
+        if ttl and cached and time.monotonic() - cached[0] < ttl:
+            _cache.move_to_end(key)
+            logger.debug("count cache hit for %s", key)
+            return cached[1]
+
+    threshold: int | None = current_app.config.get("COUNT_ESTIMATE_THRESHOLD")
+    counted: Select = stmt.order_by(None).with_only_columns(model.id)
+    if threshold is not None:
+        counted = counted.limit(threshold + 1)
+    total: int = session.scalar(
+        select(func.count())
+        .select_from(counted.subquery())
+        .execution_options(**options)
+    )
+
+    if ttl:
+        with _lock:
+            _cache[key] = (time.monotonic(), total)
+            _cache.move_to_end(key)
+            while len(_cache) > current_app.config.get("COUNT_CACHE_SIZE", 1024):
+                _cache.popitem(last=False)
+    return total
+
+
+def set_total(
+    pagination: Pagination,
+    session: scoped_session,
+    stmt: Select,
+    model: JournalBaseModel,
+    shared: bool | None = None,
+    cache: bool = True,
+) -> None:
+    """Set `pagination.total` from `count_total`.
+
+    Estimated totals are marked with `pagination.estimated`, and always leave
+    room for the page following a full page since the real total is unknown.
+    """
+    total = count_total(session, stmt, model=model, shared=shared, cache=cache)
+    threshold: int | None = current_app.config.get("COUNT_ESTIMATE_THRESHOLD")
+
+    pagination.estimated = threshold is not None and total > threshold
+    if pagination.estimated:
+        seen = (pagination.page - 1) * pagination.per_page + len(pagination.items)
+        total = max(total, seen + int(len(pagination.items) == pagination.per_page))
+    pagination.total = total
+
+
+def _track_flush(session: Session, flush_context: UOWTransaction) -> None:
+    changed: set[str] = session.info.setdefault("count_models", set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, db.Model):
+            changed.add(type(obj).__name__)
+
+
+def _invalidate(session: Session) -> None:
+    changed: set[str] = session.info.pop("count_models", set())
+    with _lock:
+        for name in changed:
+            _versions[name] = _versions.get(name, 0) + 1
+    if changed:
+        logger.debug("invalidated cached counts for %s", changed)
+
+
+def _discard(session: Session) -> None:
+    session.info.pop("count_models", None)
+
+
+def init_counts() -> None:
+    for identifier, fn in [
+        ("after_flush", _track_flush),
+        ("after_commit", _invalidate),
+        ("after_rollback", _discard),
+    ]:
+        if not event.contains(Session, identifier, fn):
+            event.listen(Session, identifier, fn)
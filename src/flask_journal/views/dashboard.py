@@ -0,0 +1,99 @@
+import logging
+
+from flask import current_app
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import load_only, selectinload
+
+from ..models import Entry, Tag, User, db
+from ..models.tag import EntryTags
+
+logger = logging.getLogger(__name__)
+
+
+def entry_count(user: User) -> int:
+    """Number of live entries owned by `user`.
+
+    Args:
+        user (User): owner of the entries
+
+    Returns:
+        int: number of entries
+    """
+    return db.session.scalar(
+        select(func.count(Entry.id)).where(Entry.user_id == user.id)
+    )
+
+
+def recent_entries(user: User, limit: int = 5) -> list[Entry]:
+    """Most recently created entries of `user`, newest first.
+
+    Only the columns needed to render a preview are loaded, tags are loaded
+    with a single extra query for all entries.
+
+    Args:
+        user (User): owner of the entries
+        limit (int): maximum number of entries
+
+    Returns:
+        list[Entry]: entries ordered by creation time
+    """
+    return list(
+        db.session.scalars(
+            select(Entry)
+            .where(Entry.user_id == user.id)
+            .options(
+                load_only(
+                    Entry.id,
+                    Entry._title,
+                    Entry._data,
+                    Entry.storage,
+                    Entry.created_at,
+                ),
+                selectinload(Entry.tags).load_only(Tag.id, Tag.name),
+            )
+            .order_by(Entry.created_at.desc(), Entry.id.desc())
+            .limit(limit)
+        )
+    )
+
+
+def tag_counts(user: User) -> list[Row]:
+    """Tags of `user` with the number of live entries using each tag.
+
+    Counts come from a single grouped query over `entry_tags`, tags without
+    entries are included with a count of 0. With `MATERIALIZED_TAG_COUNTS`
+    the counts maintained in `Tag.entry_count` are read instead.
+
+    Args:
+        user (User): owner of the tags
+
+    Returns:
+        list[Row]: rows with `id`, `name` and `entry_count`, ordered by name
+    """
+    if current_app.config.get("MATERIALIZED_TAG_COUNTS"):
+        return list(
+            db.session.execute(
+                select(Tag.id, Tag.name, Tag.entry_count)
+                .where(Tag.user_id == user.id)
+                .order_by(Tag.name)
+            )
+        )
+
+    counts = (
+        select(EntryTags.c.tag_id, func.count().label("entry_count"))
+        .join(Entry, Entry.id == EntryTags.c.entry_id)
+        .group_by(EntryTags.c.tag_id)
+        .subquery()
+    )
+    return list(
+        db.session.execute(
+            select(
+                Tag.id,
+                Tag.name,
+                func.coalesce(counts.c.entry_count, 0).label("entry_count"),
+            )
+            .outerjoin(counts, counts.c.tag_id == Tag.id)
+            .where(Tag.user_id == user.id)
+            .order_by(Tag.name)
+        )
+    )
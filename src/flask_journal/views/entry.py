@@ -2,12 +2,13 @@ from flask_login import login_required
 
 from ..forms import EntryForm
 from ..models import Entry
-from . import bp, werkzeugResponse
+from . import bp, etag, werkzeugResponse
 from .base import form_view, table_view
 
 
 @bp.route("/entries")
 @login_required
+@etag.conditional(etag.collection(Entry, shared=False))
 def entries() -> werkzeugResponse | str:
     return table_view(
         Entry,
@@ -26,6 +27,7 @@ def entries() -> werkzeugResponse | str:
 
 @bp.route("/entries/shared")
 @login_required
+@etag.conditional(etag.collection(Entry, shared=True))
 def shared_entries() -> werkzeugResponse | str:
     return table_view(
         Entry,
@@ -44,6 +46,7 @@ def shared_entries() -> werkzeugResponse | str:
 
 @bp.route("/entry", methods=["GET", "POST"])
 @login_required
+@etag.conditional(etag.record(Entry))
 def entry() -> werkzeugResponse | str:
     return form_view(
         model=Entry,
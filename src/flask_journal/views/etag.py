@@ -0,0 +1,168 @@
+import hashlib
+import logging
+import time
+import typing as t
+from datetime import UTC, datetime, timedelta
+from functools import wraps
+
+from flask import after_this_request, current_app, request, session
+from flask_login import current_user
+from sqlalchemy import Select, func
+
+from ..models import db
+from ..models.base import JournalBaseModel
+from . import utils, werkzeugResponse
+from .user_settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Database timestamps may only have a resolution of a second, rows changed more
+# recently could change again without a new timestamp, so get no validators
+FRESH = timedelta(seconds=2)
+SAFE_METHODS = ("GET", "HEAD")
+
+
+Validator = t.Callable[..., tuple | None]
+
+
+def row_validator(stmt: Select, model: JournalBaseModel) -> tuple | None:
+    """Timestamps of the single row selected by `stmt`, None if there is none."""
+    row = db.session.execute(
+        stmt.with_only_columns(model.id, model.updated_at, model.deleted_at)
+    ).first()
+    return None if row is None else tuple(row)
+
+
+def collection_validator(stmt: Select, model: JournalBaseModel) -> tuple:
+    """Summary of the rows selected by `stmt` which changes with any of them.
+
+    Count and id sum change when rows are added or removed, the latest
+    timestamps when a row changes.
+    """
+    return tuple(
+        db.session.execute(
+            stmt.order_by(None).with_only_columns(
+                func.count(model.id),
+                func.coalesce(func.sum(model.id), 0),
+                func.max(model.created_at),
+                func.max(model.updated_at),
+                func.max(model.deleted_at),
+            )
+        ).one()
+    )
+
+
+def _user_key() -> tuple:
+    """Parts of the user rendering a page which change its markup."""
+    if not current_user.is_authenticated:
+        return ()
+    key: tuple = (
+        current_user.id,
+        sorted(current_user.role_names),
+        get_settings(current_user.id).theme,
+    )
+    if current_app.config.get("WTF_CSRF_ENABLED", True):
+        # Renew pages before their embedded CSRF tokens expire
+        limit = current_app.config.get("WTF_CSRF_TIME_LIMIT") or 3600
+        key += (int(time.time() // (limit / 2)),)
+    return key
+
+
+def _last_modified(parts: tuple) -> datetime | None:
+    stamps = [
+        p if p.tzinfo else p.replace(tzinfo=UTC)
+        for p in parts
+        if isinstance(p, datetime)
+    ]
+    return max(stamps, default=None)
+
+
+def not_modified(
+    *parts: t.Any, user_key: t.Callable[[], tuple] = _user_key
+) -> werkzeugResponse | None:
+    """Answer a conditional GET before the page is loaded and rendered.
+
+    The ETag is a hash of `parts`, cheap validators of the data shown by the
+    page, and of the user viewing it. Last-Modified is the latest timestamp of
+    `parts`. A matching `If-None-Match` is answered with 304, otherwise both
+    headers are added to the rendered page.
+
+    Args:
+        *parts (t.Any): validators, e.g. from `row_validator`
+        user_key (t.Callable[[], tuple]): parts of the user which change the
+            response, defaults to those of a rendered page
+
+    Returns:
+        werkzeugResponse | None: 304 response, None to render the page
+    """
+    if request.method not in SAFE_METHODS or "_flashes" in session:
+        return None
+    last_modified = _last_modified(parts)
+    if last_modified and datetime.now(UTC) - last_modified < FRESH:
+        return None
+
+    etag = hashlib.sha1(
+        repr((request.full_path, parts, user_key())).encode(), usedforsecurity=False
+    ).hexdigest()
+
+    def add_validators(response: werkzeugResponse) -> werkzeugResponse:
+        if response.status_code in (200, 304):
+            response.set_etag(etag, weak=True)
+            response.last_modified = last_modified
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+        return response
+
+    if request.if_none_match.contains_weak(etag):
+        logger.debug("not modified %s", request.full_path)
+        return add_validators(current_app.response_class(status=304))
+    after_this_request(add_validators)
+    return None
+
+
+def conditional(
+    validator: Validator, user_key: t.Callable[[], tuple] = _user_key
+) -> t.Callable[[t.Callable], t.Callable]:
+    """Answer conditional GETs of a view with `not_modified`.
+
+    `validator` is called with the arguments of the view and returns the parts
+    of the ETag, or None if the page can't be validated (e.g. a new record).
+    `user_key` is passed on to `not_modified`.
+    """
+
+    def decorator(view: t.Callable) -> t.Callable:
+        @wraps(view)
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> werkzeugResponse | str:
+            if request.method in SAFE_METHODS:
+                parts = validator(*args, **kwargs)
+                if parts is not None and (
+                    response := not_modified(*parts, user_key=user_key)
+                ):
+                    return response
+            return view(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record(model: JournalBaseModel) -> Validator:
+    """Validator of the record of `model` selected by the request id."""
+
+    def validator(id: int | None = None) -> tuple | None:
+        if id is None:
+            id = utils.process_request_id()
+        if id is None:
+            return None
+        return row_validator(utils.build_select(model, filters=dict(id=id)), model)
+
+    return validator
+
+
+def collection(model: JournalBaseModel, shared: bool | None = None) -> Validator:
+    """Validator of the records of `model` listed by `table_view`."""
+
+    def validator() -> tuple:
+        return collection_validator(utils.build_select(model, shared=shared), model)
+
+    return validator
@@ -0,0 +1,218 @@
+import hashlib
+import importlib
+import logging
+import os
+import threading
+import time
+import typing as t
+import uuid
+from collections import OrderedDict
+
+from flask import Flask, current_app
+from flask_login import current_user
+from jinja2 import nodes
+from jinja2.ext import Extension
+from jinja2.parser import Parser
+from markupsafe import Markup
+from sqlalchemy import event
+from sqlalchemy.orm import Session, UOWTransaction
+
+from ..models import Entry, Tag
+
+logger = logging.getLogger(__name__)
+
+EXTENSION_KEY = "fragment_cache"
+
+
+class FragmentBackend:
+    """Store of rendered fragments, shared by the workers using it."""
+
+    def __init__(self: t.Self, app: Flask) -> None:
+        pass
+
+    def get(self: t.Self, key: str) -> str | None:
+        raise NotImplementedError
+
+    def set(self: t.Self, key: str, value: str, ttl: float | None) -> None:
+        """Store `value`, forever if `ttl` is None."""
+        raise NotImplementedError
+
+
+class MemoryBackend(FragmentBackend):
+    """LRU cache of the process, other workers keep their fragments until
+    `FRAGMENT_CACHE_TTL` expires."""
+
+    def __init__(self: t.Self, app: Flask) -> None:
+        self.size: int = app.config.get("FRAGMENT_CACHE_SIZE", 1024)
+        self._data: OrderedDict[str, tuple[float | None, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self: t.Self, key: str) -> str | None:
+        with self._lock:
+            expires, value = self._data.get(key, (None, None))
+            if expires is not None and expires < time.monotonic():
+                del self._data[key]
+                return None
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self: t.Self, key: str, value: str, ttl: float | None) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.size:
+                self._data.popitem(last=False)
+
+
+class FileSystemBackend(FragmentBackend):
+    """One file per fragment in `FRAGMENT_CACHE_DIR`, shared by the workers
+    of a host."""
+
+    def __init__(self: t.Self, app: Flask) -> None:
+        self.path: str = app.config.get("FRAGMENT_CACHE_DIR") or os.path.join(
+            app.instance_path, "fragments"
+        )
+        os.makedirs(self.path, exist_ok=True)
+
+    def _file(self: t.Self, key: str) -> str:
+        name = hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()
+        return os.path.join(self.path, name)
+
+    def get(self: t.Self, key: str) -> str | None:
+        try:
+            with open(self._file(key), encoding="utf-8") as f:
+                expires, value = f.read().split("\n", 1)
+        except (OSError, ValueError):
+            return None
+        if expires and float(expires) < time.time():
+            return None
+        return value
+
+    def set(self: t.Self, key: str, value: str, ttl: float | None) -> None:
+        expires = "" if ttl is None else repr(time.time() + ttl)
+        path = self._file(key)
+        tmp = f"{path}.{uuid.uuid4().hex}"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(f"{expires}\n{value}")
+        os.replace(tmp, path)
+
+
+BACKENDS: dict[str, type[FragmentBackend]] = {
+    "memory": MemoryBackend,
+    "filesystem": FileSystemBackend,
+}
+
+
+def load_backend(app: Flask) -> FragmentBackend:
+    """Backend named by `FRAGMENT_CACHE_BACKEND`, `module:Class` for others."""
+    name: str = app.config.get("FRAGMENT_CACHE_BACKEND", "memory")
+    if name in BACKENDS:
+        return BACKENDS[name](app)
+    module, _, attr = name.partition(":")
+    return getattr(importlib.import_module(module), attr)(app)
+
+
+def _version_key(user_id: int) -> str:
+    return f"version:{user_id}"
+
+
+def collection_version(backend: FragmentBackend, user_id: int) -> str:
+    """Version of the entries and tags of `user_id`, new after each commit."""
+    version = backend.get(_version_key(user_id))
+    if version is None:
+        version = bump(backend, user_id)
+    return version
+
+
+def bump(backend: FragmentBackend, user_id: int) -> str:
+    # Random versions stay unique when workers bump concurrently
+    version = uuid.uuid4().hex
+    backend.set(_version_key(user_id), version, None)
+    return version
+
+
+def cached(key: str | t.Sequence[t.Any], render: t.Callable[[], str]) -> Markup:
+    """Fragment of the current user named `key`, rendered by `render` on a miss.
+
+    Args:
+        key (str | t.Sequence[t.Any]): name of the fragment and its arguments
+        render (t.Callable[[], str]): renders the fragment, safe markup
+
+    Returns:
+        Markup: the rendered fragment
+    """
+    ttl: float = current_app.config.get("FRAGMENT_CACHE_TTL", 0)
+    if not ttl or not current_user.is_authenticated:
+        return Markup(render())
+
+    backend: FragmentBackend = current_app.extensions[EXTENSION_KEY]
+    parts = [key] if isinstance(key, str) else key
+    full_key = ":".join(
+        [
+            "fragment",
+            str(current_user.id),
+            collection_version(backend, current_user.id),
+            *map(str, parts),
+        ]
+    )
+    value = backend.get(full_key)
+    if value is None:
+        value = str(render())
+        backend.set(full_key, value, ttl)
+    else:
+        logger.debug("fragment cache hit for %s", full_key)
+    return Markup(value)
+
+
+class FragmentCacheExtension(Extension):
+    """`{% cache "name", arg %}...{% endcache %}` caches its body with `cached`."""
+
+    tags = {"cache"}
+
+    def parse(self: t.Self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        while parser.stream.skip_if("comma"):
+            args.append(parser.parse_expression())
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        return nodes.CallBlock(
+            self.call_method("_cache", [nodes.List(args)]), [], [], body
+        ).set_lineno(lineno)
+
+    def _cache(self: t.Self, key: list[t.Any], caller: t.Callable[[], str]) -> Markup:
+        return cached(key, caller)
+
+
+def _track_flush(session: Session, flush_context: UOWTransaction) -> None:
+    changed: set[int] = session.info.setdefault("fragment_users", set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, (Entry, Tag)) and obj.user_id is not None:
+            changed.add(obj.user_id)
+
+
+def _invalidate(session: Session) -> None:
+    changed: set[int] = session.info.pop("fragment_users", set())
+    if not changed or EXTENSION_KEY not in current_app.extensions:
+        return
+    backend: FragmentBackend = current_app.extensions[EXTENSION_KEY]
+    for user_id in changed:
+        bump(backend, user_id)
+    logger.debug("invalidated cached fragments of users %s", changed)
+
+
+def _discard(session: Session) -> None:
+    session.info.pop("fragment_users", None)
+
+
+def init_fragments(app: Flask) -> None:
+    app.extensions[EXTENSION_KEY] = load_backend(app)
+    app.jinja_env.add_extension(FragmentCacheExtension)
+    for identifier, fn in [
+        ("after_flush", _track_flush),
+        ("after_commit", _invalidate),
+        ("after_rollback", _discard),
+    ]:
+        if not event.contains(Session, identifier, fn):
+            event.listen(Session, identifier, fn)
@@ -1,17 +1,22 @@
+from functools import partial
+
 from flask import render_template
 from flask_security import current_user
 
 from ..models import User
-from . import bp, werkzeugResponse
+from . import bp, dashboard, werkzeugResponse
+from .user_settings import get_settings
 
 
 @bp.route("/home")
 def home() -> werkzeugResponse | str:
     kwargs = {"tags": None, "entry_count": None, "entries": None}
     if isinstance(current_user, User):
-        if current_user.settings.home_tags:
-            kwargs["tags"] = current_user.tags
-            kwargs["entry_count"] = len(current_user.entries)
-        if current_user.settings.home_preview:
-            kwargs["entries"] = current_user.entries[-5:]
+        settings = get_settings(current_user.id)
+        # Loaded by the template, only when its cached fragment is stale
+        if settings.home_tags:
+            kwargs["tags"] = partial(dashboard.tag_counts, current_user)
+            kwargs["entry_count"] = partial(dashboard.entry_count, current_user)
+        if settings.home_preview:
+            kwargs["entries"] = partial(dashboard.recent_entries, current_user)
     return render_template("journal/home.html", title="Home", **kwargs)
@@ -0,0 +1,182 @@
+import base64
+import json
+import logging
+import typing as t
+from datetime import datetime
+
+from sqlalchemy import Select, func, inspect, select, tuple_
+from sqlalchemy.orm import scoped_session
+from sqlalchemy.orm.attributes import QueryableAttribute
+from sqlalchemy.sql import desc
+
+from ..models.base import JournalBaseModel
+
+logger = logging.getLogger(__name__)
+
+
+def encode_cursor(values: t.Sequence[t.Any]) -> str:
+    """Encode key values into an opaque url safe cursor token.
+
+    Args:
+        values (t.Sequence[t.Any]): key values of the boundary row
+
+    Returns:
+        str: url safe cursor token
+    """
+    payload = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("UTF-8")).decode("UTF-8").rstrip("=")
+
+
+def decode_cursor(token: str, keys: t.Sequence[QueryableAttribute]) -> tuple:
+    """Decode a cursor token created by `encode_cursor`.
+
+    Values are coerced back to the python type of the matching key column.
+
+    Args:
+        token (str): cursor token
+        keys (t.Sequence[QueryableAttribute]): key columns of the cursor
+
+    Raises:
+        ValueError: token is malformed or doesn't match keys
+
+    Returns:
+        tuple: key values of the boundary row
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except ValueError as exc:
+        raise ValueError("invalid cursor: %s" % token) from exc
+
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise ValueError("invalid cursor: %s" % token)
+
+    return tuple(_coerce(key, value) for key, value in zip(keys, values))
+
+
+def _coerce(key: QueryableAttribute, value: t.Any) -> t.Any:
+    if value is None:
+        return None
+    try:
+        python_type: type = key.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        value = python_type(value)
+    except (TypeError, ValueError, OverflowError) as exc:
+        raise ValueError("invalid cursor value: %s" % value) from exc
+    if python_type is int and not -(2**63) <= value < 2**63:
+        raise ValueError("invalid cursor value: %s" % value)
+    return value
+
+
+def key_fields(model: JournalBaseModel, order_field: str | None) -> tuple[str, ...]:
+    """Key fields used to build cursors for `model` ordered by `order_field`.
+
+    Only real, non nullable columns can be compared as row values, hybrid
+    properties and nullable columns fall back to ordering by `id`.
+
+    Args:
+        model (JournalBaseModel): model being paginated
+        order_field (str | None): requested order field
+
+    Returns:
+        tuple[str, ...]: key fields, always ending with `id`
+    """
+    column = inspect(model).columns.get(order_field) if order_field else None
+    if order_field == "id" or column is None or column.nullable:
+        return ("id",)
+    return (order_field, "id")
+
+
+class KeysetPagination:
+    """Cursor based pagination over `order_field` with `id` as tie breaker.
+
+    Pages are located with a range condition on the key columns instead
+    of an OFFSET, and no COUNT query is issued, so every page costs the
+    same index range scan regardless of how deep it is.
+    """
+
+    def __init__(
+        self: t.Self,
+        session: scoped_session,
+        select: Select,
+        model: JournalBaseModel,
+        order_field: str = "id",
+        descending: bool = False,
+        per_page: int = 10,
+        after: str | None = None,
+        before: str | None = None,
+    ) -> None:
+        if after and before:
+            raise ValueError("after and before cursors are mutually exclusive")
+        if per_page < 1:
+            raise ValueError("per_page must be positive: %d" % per_page)
+
+        self.per_page = per_page
+        self.fields: tuple[str, ...] = key_fields(model, order_field)
+        self._model = model
+        self._session = session
+        self._keys: list[QueryableAttribute] = [getattr(model, f) for f in self.fields]
+
+        reverse: bool = bool(before)
+        cursor: str | None = before if reverse else after
+        values: tuple | None = decode_cursor(cursor, self._keys) if cursor else None
+
+        logger.debug(
+            "keyset page of %d by %s %s cursor %s",
+            per_page,
+            self.fields,
+            "before" if reverse else "after",
+            cursor,
+        )
+        items, more = self._fetch(select, values, ascending=descending == reverse)
+        if values is not None and not items:
+            # cursor is past the end of the results, show the closest page instead
+            logger.debug("cursor %s is out of range", cursor)
+            reverse, values = not reverse, None
+            items, more = self._fetch(select, values, ascending=descending == reverse)
+
+        if reverse:
+            items.reverse()
+
+        self.items = items
+        self.has_next: bool = values is not None if reverse else more
+        self.has_prev: bool = more if reverse else values is not None
+
+    def _fetch(
+        self: t.Self, stmt: Select, values: tuple | None, ascending: bool
+    ) -> tuple[list[JournalBaseModel], bool]:
+        if values is not None:
+            key_exp, bound = self._key_exp(values)
+            stmt = stmt.where(key_exp > bound if ascending else key_exp < bound)
+
+        stmt = stmt.order_by(*(key if ascending else desc(key) for key in self._keys))
+        items = list(self._session.scalars(stmt.limit(self.per_page + 1)))
+        return items[: self.per_page], len(items) > self.per_page
+
+    def _key_exp(self: t.Self, values: tuple) -> tuple[t.Any, t.Any]:
+        if len(self._keys) == 1:
+            return self._keys[0], values[0]
+
+        # Compare against the stored value of the boundary row, bound values
+        # don't always match the storage format, ie server generated datetimes
+        # on sqlite. The cursor value is only used if the row is gone.
+        order_key, id_key = self._keys
+        stored = select(order_key).where(id_key == values[-1]).scalar_subquery()
+        return tuple_(*self._keys), tuple_(func.coalesce(stored, values[0]), values[-1])
+
+    def _cursor(self: t.Self, item: JournalBaseModel) -> str:
+        return encode_cursor([getattr(item, f) for f in self.fields])
+
+    @property
+    def next_cursor(self: t.Self) -> str | None:
+        return self._cursor(self.items[-1]) if self.has_next else None
+
+    @property
+    def prev_cursor(self: t.Self) -> str | None:
+        return self._cursor(self.items[0]) if self.has_prev else None
@@ -0,0 +1,53 @@
+from flask import current_app, jsonify, request, url_for
+from flask_login import login_required
+
+from ..models import Entry, db, search as entry_search
+from . import bp, utils, werkzeugResponse
+from .base import table_view
+
+
+@bp.route("/search")
+@login_required
+def search() -> werkzeugResponse | str:
+    query: str = request.args.get("q", "")
+    return table_view(
+        Entry,
+        titles=[
+            ("id", "#", 1),
+            ("user", "Owner", 2),
+            ("title", "Title", 5),
+            ("tag_names", "Tags", 2),
+            ("created_at", "Created At", 2),
+        ],
+        descending=True,
+        endpoint=".entry",
+        where=Entry.id.in_(entry_search.match(db.session.get_bind(), query)),
+    )
+
+
+@bp.route("/api/search")
+@login_required
+def search_api() -> werkzeugResponse:
+    query: str = request.args.get("q", "")
+    limit: int = min(
+        request.args.get("limit", 20, type=int),
+        current_app.config.get("MAX_PAGE_SIZE", 100),
+    )
+    stmt = (
+        utils.build_select(Entry)
+        .where(Entry.id.in_(entry_search.match(db.session.get_bind(), query)))
+        .order_by(Entry.created_at.desc(), Entry.id.desc())
+        .limit(max(limit, 0))
+    )
+    return jsonify(
+        query=query,
+        results=[
+            {
+                "id": entry.id,
+                "title": entry.title,
+                "created_at": entry.created_at.isoformat(),
+                "url": url_for(".entry", id=entry.id),
+            }
+            for entry in db.session.scalars(stmt)
+        ],
+    )
@@ -1,9 +1,11 @@
 from flask import render_template
 from flask_login import login_required
+from sqlalchemy import select
 
 from ..forms import TagForm
-from ..models import Tag, db
-from . import bp, utils, werkzeugResponse
+from ..models import Entry, Tag, db
+from ..models.tag import EntryTags
+from . import bp, etag, utils, werkzeugResponse
 from .base import form_view, table_view
 
 
@@ -31,11 +33,21 @@ def tag(id: int | None = None) -> werkzeugResponse | str:
     )
 
 
+def tag_entries_validator(id: int) -> tuple | None:
+    tag = etag.record(Tag)(id)
+    if tag is None:
+        return None
+    entries = select(Entry).join(EntryTags).where(EntryTags.c.tag_id == id)
+    return tag + etag.collection_validator(entries, Entry)
+
+
 @bp.route("/tag/<int:id>/entries")
+@etag.conditional(tag_entries_validator)
 def tag_entries(id: int) -> werkzeugResponse | str:
     tag = db.session.scalar(utils.build_select(model=Tag, filters=dict(id=id)))
     return render_template(
         "journal/tag.html",
         title=tag.name,
-        entries=tag.entries,
+        tag_id=tag.id,
+        entries=lambda: tag.entries,
     )
@@ -1,6 +1,7 @@
 from enum import StrEnum, auto
+from functools import cache
 
-from flask import current_app
+from flask import current_app, url_for
 from flask_login import current_user
 from markupsafe import Markup
 
@@ -34,32 +35,48 @@ class Theme(StrEnum):
     zephyr = auto()
 
 
+@cache
+def theme_url(theme: str | None, version: str, css_filename: str) -> str:
+    """CDN url of a Bootswatch `theme` stylesheet, Bootstrap itself if None."""
+    CDN_BASE = "https://cdn.jsdelivr.net/npm"
+    base_path = (
+        f"{CDN_BASE}/bootswatch@{version}/dist/{theme.lower()}"
+        if theme
+        else f"{CDN_BASE}/bootstrap@{version}/dist/css"
+    )
+    return f"{base_path}/{css_filename}"
+
+
+def local_theme_url(theme: str | None, css_filename: str) -> str:
+    """Url of the `theme` stylesheet shipped with Bootstrap-Flask."""
+    path = f"css/bootswatch/{theme.lower()}" if theme else "css"
+    return url_for("bootstrap.static", filename=f"{path}/{css_filename}")
+
+
 def load_theme() -> Markup:
     """Load Bootstrap's css resources with given version.
 
     .. versionadded:: 0.1.0
 
-    :param version: The version of Bootstrap.
+    The theme comes from the cached settings of the user, so rendering the
+    layout does not query the database on a cache hit. With `OFFLINE_ASSETS`
+    the stylesheet is served by the app under a fingerprinted name.
     """
-    bs = current_app.extensions["bootstrap"]
-    CDN_BASE = "https://cdn.jsdelivr.net/npm"
-
-    bootswatch_theme = (
-        current_user.settings.theme
-        if current_user
-        and current_user.is_authenticated
-        and current_user.settings
-        and current_user.settings.theme != "default"
-        else current_app.config["BOOTSTRAP_BOOTSWATCH_THEME"]
-    )
-
-    version = bs.bootstrap_version
-    base_path = (
-        f"{CDN_BASE}/bootswatch@{version}/dist/{bootswatch_theme.lower()}"
-        if bootswatch_theme
-        else f"{CDN_BASE}/bootstrap@{version}/dist/css"
-    )
+    from .assets import preload
+    from .user_settings import get_settings
 
-    bootstrap_url = f"{base_path}/{bs.bootstrap_css_filename}"
+    bs = current_app.extensions["bootstrap"]
+    bootswatch_theme = current_app.config["BOOTSTRAP_BOOTSWATCH_THEME"]
+    if current_user and current_user.is_authenticated:
+        theme = get_settings(current_user.id).theme
+        if theme != "default":
+            bootswatch_theme = theme
 
-    return Markup(f'<link rel="stylesheet" href="{bootstrap_url}">')
+    if current_app.config.get("OFFLINE_ASSETS"):
+        url = local_theme_url(bootswatch_theme, bs.bootstrap_css_filename)
+    else:
+        url = theme_url(
+            bootswatch_theme, bs.bootstrap_version, bs.bootstrap_css_filename
+        )
+    preload(url, "style")
+    return Markup(f'<link rel="stylesheet" href="{url}">')
@@ -0,0 +1,94 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from flask import current_app
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, UOWTransaction
+
+from ..models import UserSettings, db
+from .themes import Theme
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedSettings:
+    """Settings of a user, detached from any session."""
+
+    theme: Theme = Theme.default
+    home_tags: bool = True
+    home_preview: bool = True
+
+
+# Per process state, other workers see changes once SETTINGS_CACHE_TTL expires
+_cache: dict[int, tuple[float, CachedSettings]] = {}
+_lock = threading.Lock()
+
+
+def get_settings(user_id: int) -> CachedSettings:
+    """Settings of the user `user_id`, loaded at most once per cache lifetime.
+
+    Args:
+        user_id (int): id of the user
+
+    Returns:
+        CachedSettings: the user's settings, defaults if the user has none
+    """
+    ttl: float = current_app.config.get("SETTINGS_CACHE_TTL", 0)
+    with _lock:
+        cached = _cache.get(user_id)
+    if ttl and cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    row = db.session.execute(
+        select(UserSettings.theme, UserSettings.home_tags, UserSettings.home_preview)
+        .where(UserSettings.user_id == user_id)
+        .limit(1)
+    ).first()
+    settings = (
+        CachedSettings(
+            theme=row.theme or Theme.default,
+            home_tags=row.home_tags is not False,
+            home_preview=row.home_preview is not False,
+        )
+        if row
+        else CachedSettings()
+    )
+    if ttl:
+        with _lock:
+            _cache[user_id] = (time.monotonic(), settings)
+            while len(_cache) > current_app.config.get("SETTINGS_CACHE_SIZE", 1024):
+                _cache.pop(next(iter(_cache)))
+    return settings
+
+
+def _track_flush(session: Session, flush_context: UOWTransaction) -> None:
+    changed: set[int] = session.info.setdefault("settings_users", set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, UserSettings):
+            changed.add(obj.user_id)
+
+
+def _invalidate(session: Session) -> None:
+    changed: set[int] = session.info.pop("settings_users", set())
+    with _lock:
+        for user_id in changed:
+            _cache.pop(user_id, None)
+    if changed:
+        logger.debug("invalidated cached settings of users %s", changed)
+
+
+def _discard(session: Session) -> None:
+    session.info.pop("settings_users", None)
+
+
+def init_settings_cache() -> None:
+    for identifier, fn in [
+        ("after_flush", _track_flush),
+        ("after_commit", _invalidate),
+        ("after_rollback", _discard),
+    ]:
+        if not event.contains(Session, identifier, fn):
+            event.listen(Session, identifier, fn)
@@ -1,16 +1,22 @@
 import logging
 import typing as t
+from functools import cache
 
 from flask import abort, flash, request
 from flask_security import current_user
-from sqlalchemy import Select, select
+from sqlalchemy import Select, inspect, select
+from sqlalchemy.orm import QueryableAttribute, joinedload, load_only, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 from wtforms.fields import SubmitField
 
 from flask_journal.forms.base import CustomForm
 from flask_journal.models.base import JournalBaseModel
+from flask_journal.security.utils import current_user_id
 
 logger = logging.getLogger(__name__)
 
+Loader = t.Callable[[QueryableAttribute], ORMOption]
+
 
 def process_request_id() -> int | None:
     id: int | None = None
@@ -34,32 +40,84 @@ def build_select(
     include_deleted: bool = (
         True if current_user.has_role("manage") else False  # pyright: ignore
     )
-    stmt: Select = select(model)
+    if not (model.ownable or model.shareable) and not current_user.has_role("admin"):
+        flash(f"Unable to Access Resource {model.__name__}")
+        return abort(403)
+
+    stmt: Select = _base_select(model, shared, include_deleted)
     if filters is not None:
         stmt = stmt.filter_by(**filters)
+    return stmt
+
 
+@cache
+def _base_select(
+    model: JournalBaseModel, shared: bool | None, include_deleted: bool
+) -> Select:
+    """Statement selecting the rows of `model` visible to the logged in user.
+
+    Built once per worker for each combination of arguments, the user id is
+    bound when the statement is executed.
+    """
+    logger.debug("build select for %s, shared %s", model.__name__, shared)
+    stmt: Select = select(model)
     match (model.ownable, model.shareable, shared):
         case (True, True, None):
             stmt = stmt.where(
-                (model.user == current_user)
-                | (model.shared_with.any(model.shared_with.contains(current_user)))
+                (model.user_id == current_user_id)
+                | model.shared_with_user(current_user_id)
             )
 
         case (True, True, True):
-            stmt = stmt.where(
-                model.shared_with.any(model.shared_with.contains(current_user))
-            )
+            stmt = stmt.where(model.shared_with_user(current_user_id))
 
         case (False, False, _):
-            if not current_user.has_role("admin"):
-                flash(f"Unable to Access Resource {model.__name__}")
-                return abort(403)
+            pass
 
         case _:
-            stmt = stmt.filter_by(user=current_user)
+            stmt = stmt.filter_by(user_id=current_user_id)
 
-    stmt = stmt.execution_options(include_deleted=include_deleted)
-    return stmt
+    return stmt.execution_options(include_deleted=include_deleted)
+
+
+def loader_options(
+    model: JournalBaseModel,
+    fields: t.Iterable[str],
+    loaders: dict[str, Loader] | None = None,
+) -> list[ORMOption]:
+    """Loader options that load only what is needed to read `fields`.
+
+    Columns not needed by `fields` are deferred, fields resolve to columns or
+    relationships directly or through `model.loader_fields`. Relationships are
+    loaded eagerly, joined for single objects and selectin for collections,
+    unless `loaders` names another loader for the relationship.
+
+    Args:
+        model (JournalBaseModel): model being selected
+        fields (t.Iterable[str]): attributes read from every row
+        loaders (dict[str, Loader] | None): loader of each relationship, ie.
+            `{"user": selectinload}`
+
+    Returns:
+        list[ORMOption]: options for the select, empty if `model` is not mapped
+    """
+    mapper = inspect(model, raiseerr=False)
+    if mapper is None:
+        return []
+
+    columns: set[str] = {"id", "deleted_at"}
+    options: list[ORMOption] = []
+    for field in fields:
+        for name in model.loader_fields.get(field, (field,)):
+            if name in mapper.relationships:
+                loader = (loaders or {}).get(name) or (
+                    selectinload if mapper.relationships[name].uselist else joinedload
+                )
+                options.append(loader(getattr(model, name)))
+            elif name in mapper.column_attrs:
+                columns.add(name)
+    logger.debug("load %s columns %s", model.__name__, columns)
+    return [load_only(*(getattr(model, name) for name in sorted(columns))), *options]
 
 
 def form_submit_action(form: CustomForm) -> str:
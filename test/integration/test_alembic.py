@@ -1,12 +1,107 @@
+import base64
+from pathlib import Path
+from typing import Generator
+
 import pytest
 from alembic import command
-from alembic.config import Config
+from alembic.config import Config as AlembicConfig
+from flask import Flask, current_app
+from flask_migrate import downgrade, upgrade
+from sqlalchemy import insert, text
+
+from flask_journal.app import create_app
+from flask_journal.config import Config
+from flask_journal.models import Entry, User, db
+
+from ..config import test_config
 
 
 @pytest.mark.parametrize("url", ["mysql+pymysql://localhost"], ids=["mysql"])
 def test_alembic_sql(url: str, capsys: pytest.CaptureFixture) -> None:
-    alembic_cfg = Config("migrations/alembic.ini")
+    alembic_cfg = AlembicConfig("migrations/alembic.ini")
     alembic_cfg.set_main_option("sqlalchemy.url", url)
     command.upgrade(alembic_cfg, "head", True)
     out, err = capsys.readouterr()
     assert out.startswith("CREATE TABLE alembic_version")
+
+
+@pytest.fixture
+def file_app(tmp_path: Path) -> Generator[Flask, None, None]:
+    app = create_app(
+        Config(
+            mapping={
+                **test_config,
+                "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'journal.db'}",
+            }
+        )
+    )
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+def insert_base64_entries(n: int, storage: bool = False) -> None:
+    with db.engine.begin() as conn:
+        conn.execute(insert(User.__table__).values(email="a", password="a"))
+        conn.execute(
+            text(
+                "INSERT INTO entry (id, user_id, _title, _data%s)"
+                " VALUES (:id, 1, :title, :data%s)"
+                % ((", storage", ", 'base64'") if storage else ("", ""))
+            ),
+            [
+                {
+                    "id": i,
+                    "title": base64.b64encode(f"Title {i}".encode()).decode(),
+                    "data": base64.b64encode(f"Body é {i}".encode()).decode(),
+                }
+                for i in range(1, n + 1)
+            ],
+        )
+
+
+@pytest.mark.usefixtures("file_app")
+def test_search_index_migration() -> None:
+    downgrade(revision="9d2e7b4c1a6f")
+    insert_base64_entries(600)
+    upgrade(revision="3b8a6f2d9c4e")
+
+    with db.engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT rowid FROM entry_fts WHERE entry_fts MATCH 'body 599'")
+        ).all()
+    assert rows == [(599,)]
+
+
+@pytest.mark.usefixtures("file_app")
+def test_entry_storage_migration(monkeypatch: pytest.MonkeyPatch) -> None:
+    downgrade(revision="7e4c2a9f1b3d")
+    insert_base64_entries(1200, storage=True)
+    upgrade()
+
+    with db.engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT id, _title, _data, storage FROM entry ORDER BY id")
+        ).all()
+    assert len(rows) == 1200
+    assert all(r[1:] == (f"Title {r[0]}", f"Body é {r[0]}", "text") for r in rows)
+    entry = db.session.get(Entry, 7)
+    assert (entry.title, entry.content) == ("Title 7", "Body é 7")
+
+    monkeypatch.setitem(current_app.config, "ENTRY_COMPRESS_THRESHOLD", 10)
+    entry.content = "compressible " * 100
+    assert entry.storage == "zlib"
+    db.session.commit()
+    db.session.remove()
+    downgrade(revision="7e4c2a9f1b3d")
+
+    with db.engine.connect() as conn:
+        stored = conn.execute(
+            text("SELECT _title, _data, storage FROM entry WHERE id = 7")
+        ).one()
+    assert stored == (
+        base64.b64encode(b"Title 7").decode(),
+        base64.b64encode(b"compressible " * 100).decode(),
+        "base64",
+    )
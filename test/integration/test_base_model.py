@@ -0,0 +1,52 @@
+import typing as t
+
+import pytest
+from flask_security.datastore import UserDatastore
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
+from flask_journal.models import Role, User
+
+
+@pytest.fixture
+def statements(db: SQLAlchemy) -> t.Generator[list[str], None, None]:
+    statements: list[str] = []
+
+    def before_execute(
+        conn: t.Any, cursor: t.Any, statement: str, *args: t.Any
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_execute)
+
+
+@pytest.mark.usefixtures("userdatastore")
+def test_find_by_ids(db: SQLAlchemy, statements: list[str]) -> None:
+    roles = Role.find_by_ids([3, 1, 99, 3])
+
+    assert [role and role.name for role in roles] == ["user", "admin", None, "user"]
+    assert roles[0] is roles[3]
+    assert len(statements) == 1
+
+
+@pytest.mark.usefixtures("userdatastore")
+def test_find_by_ids_identity_map(db: SQLAlchemy, statements: list[str]) -> None:
+    loaded = Role.find_by_ids([1, 2])
+    statements.clear()
+
+    assert Role.find_by_ids([2, 1]) == loaded[::-1]
+    assert not statements
+
+    db.session.expire(loaded[0])
+    assert Role.find_by_ids([1, 2]) == loaded
+    assert len(statements) == 1
+
+
+def test_find_by_ids_soft_deleted(db: SQLAlchemy, userdatastore: UserDatastore) -> None:
+    inactive: User = userdatastore.find_user(email="user4@example.test")
+    inactive_id = inactive.id
+    db.session.expunge_all()
+
+    assert User.find_by_ids([inactive_id]) == [None]
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+from flask import Flask
+from prometheus_client import REGISTRY
+from sqlalchemy import func, select
+
+from flask_journal.app import create_app
+from flask_journal.config import Config
+from flask_journal.models import Role, check_schema, db
+
+from ..config import test_config
+
+
+def file_config(tmp_path: Path, startup: str) -> Config:
+    return Config(
+        mapping={
+            **test_config,
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'journal.db'}",
+            "SCHEMA_STARTUP": startup,
+        }
+    )
+
+
+def test_migrate_and_seed(tmp_path: Path) -> None:
+    app: Flask = create_app(file_config(tmp_path, "skip"))
+    runner = app.test_cli_runner()
+    with pytest.raises(RuntimeError, match="flask journal migrate"):
+        check_schema(app)
+
+    result = runner.invoke(args=["journal", "migrate"])
+    assert result.exit_code == 0, result.output
+    check_schema(app)
+
+    for _ in range(2):
+        result = runner.invoke(args=["journal", "seed"])
+        assert result.exit_code == 0, result.output
+    with app.app_context():
+        assert db.session.scalar(select(func.count(Role.id))) == 3
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_fast_start(tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError):
+        create_app(file_config(tmp_path, "check"))
+
+    create_app(file_config(tmp_path, "upgrade"))
+    starts = REGISTRY.get_sample_value("journal_startup_seconds_count")
+    app = create_app(file_config(tmp_path, "check"))
+    assert REGISTRY.get_sample_value("journal_startup_seconds_count") == starts + 1
+    with app.app_context():
+        db.engine.dispose()
@@ -0,0 +1,88 @@
+import gzip
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from flask import Flask, Response
+from flask.testing import FlaskClient
+
+from flask_journal import compress
+from flask_journal.app import create_app
+from flask_journal.config import Config
+from flask_journal.models import db
+
+from ..config import test_config
+
+
+@pytest.fixture
+def compress_app(tmp_path: Path) -> Generator[Flask, None, None]:
+    app = create_app(Config(mapping={**test_config, "COMPRESS_RESPONSES": True}))
+    app.static_folder = str(tmp_path)
+    app.add_url_rule(
+        "/stream", "stream", lambda: Response((b"x" * 100 for _ in range(10)))
+    )
+    with app.app_context():
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def compress_client(compress_app: Flask) -> FlaskClient:
+    return compress_app.test_client()
+
+
+def test_compress_html(compress_client: FlaskClient) -> None:
+    rv = compress_client.get("/auth/login", headers={"Accept-Encoding": "gzip"})
+    assert rv.status_code == 200
+    assert rv.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in rv.headers["Vary"]
+    assert b"<html" in gzip.decompress(rv.data)
+    assert int(rv.headers["Content-Length"]) == len(rv.data)
+
+    rv = compress_client.get("/auth/login", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in rv.headers
+    assert b"<html" in rv.data
+
+
+def test_compress_min_size(
+    compress_app: Flask, compress_client: FlaskClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(compress_app.config, "COMPRESS_MIN_SIZE", 10**6)
+    rv = compress_client.get("/auth/login", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in rv.headers
+
+
+def test_compress_stream(compress_client: FlaskClient) -> None:
+    rv = compress_client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert rv.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(rv.data) == b"x" * 1000
+
+
+def test_compress_brotli(compress_client: FlaskClient) -> None:
+    brotli = pytest.importorskip("brotli")
+    rv = compress_client.get("/auth/login", headers={"Accept-Encoding": "gzip, br"})
+    assert rv.headers["Content-Encoding"] == "br"
+    assert b"<html" in brotli.decompress(rv.data)
+
+
+def test_precompressed_static(
+    compress_app: Flask, compress_client: FlaskClient
+) -> None:
+    css = Path(compress_app.static_folder) / "site.css"
+    css.write_text("body { margin: 0; }\n" * 100)
+    (Path(compress_app.static_folder) / "small.css").write_text("a {}")
+
+    written = [Path(path).name for path, _ in compress.precompress(str(css.parent))]
+    assert "site.css.gz" in written
+    assert "small.css.gz" not in written
+
+    rv = compress_client.get("/static/site.css", headers={"Accept-Encoding": "gzip"})
+    assert rv.headers["Content-Encoding"] == "gzip"
+    assert rv.mimetype == "text/css"
+    assert gzip.decompress(rv.data) == css.read_bytes()
+    rv.close()
+
+    rv = compress_client.get("/static/site.css")
+    assert "Content-Encoding" not in rv.headers
+    assert rv.data == css.read_bytes()
+    rv.close()
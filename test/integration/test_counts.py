@@ -0,0 +1,101 @@
+import typing as t
+
+import pytest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
+from flask_journal.models import Entry, User
+from flask_journal.views import counts
+from flask_journal.views.utils import build_select
+
+
+@pytest.fixture
+def count_queries(db: SQLAlchemy) -> t.Generator[list[str], None, None]:
+    statements: list[str] = []
+
+    def before_execute(
+        conn: t.Any, cursor: t.Any, statement: str, *args: t.Any
+    ) -> None:
+        if "count(" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_execute)
+
+
+def add_entries(db: SQLAlchemy, user: User, n: int) -> None:
+    for i in range(n):
+        db.session.add(Entry(title=f"Entry {i}", user=user))
+    db.session.commit()
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.usefixtures("logged_in_user_context")
+def test_count_cached_until_commit(
+    app: Flask,
+    db: SQLAlchemy,
+    user: User,
+    count_queries: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(app.config, "COUNT_CACHE_TTL", 60)
+    add_entries(db, user, 3)
+    stmt = build_select(Entry, shared=False)
+
+    assert counts.count_total(db.session, stmt, Entry, shared=False) == 3
+    assert counts.count_total(db.session, stmt, Entry, shared=False) == 3
+    assert len(count_queries) == 1
+
+    add_entries(db, user, 1)
+    assert counts.count_total(db.session, stmt, Entry, shared=False) == 4
+    assert len(count_queries) == 2
+
+    shared_stmt = build_select(Entry, shared=True)
+    assert counts.count_total(db.session, shared_stmt, Entry, shared=True) == 0
+    assert len(count_queries) == 3
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.usefixtures("logged_in_user_context")
+def test_count_cache_disabled(
+    app: Flask,
+    db: SQLAlchemy,
+    user: User,
+    count_queries: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(app.config, "COUNT_CACHE_TTL", 0)
+    add_entries(db, user, 2)
+    stmt = build_select(Entry, shared=False)
+
+    counts.count_total(db.session, stmt, Entry, shared=False)
+    counts.count_total(db.session, stmt, Entry, shared=False)
+    assert len(count_queries) == 2
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.parametrize(
+    ("page", "expected_total"), [(1, 11), (2, 21), (3, 25)], ids=["1", "2", "3"]
+)
+@pytest.mark.usefixtures("logged_in_user_context")
+def test_count_estimated(
+    app: Flask,
+    db: SQLAlchemy,
+    user: User,
+    monkeypatch: pytest.MonkeyPatch,
+    page: int,
+    expected_total: int,
+) -> None:
+    monkeypatch.setitem(app.config, "COUNT_ESTIMATE_THRESHOLD", 5)
+    monkeypatch.setitem(app.config, "COUNT_CACHE_TTL", 0)
+    add_entries(db, user, 25)
+    stmt = build_select(Entry, shared=False)
+
+    pagination = db.paginate(stmt, page=page, per_page=10, count=False)
+    counts.set_total(pagination, db.session, stmt, Entry, shared=False)
+
+    assert pagination.estimated
+    assert pagination.total == expected_total
+    assert pagination.has_next == (page < 3)
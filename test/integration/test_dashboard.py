@@ -0,0 +1,98 @@
+import pytest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import select, text
+
+from flask_journal.models import Entry, Tag, User
+from flask_journal.views import dashboard
+
+
+@pytest.fixture
+def journal(db: SQLAlchemy, user: User) -> list[Entry]:
+    tags = [Tag(name=name, user=user) for name in ["b", "a", "unused"]]
+    db.session.add_all(tags)
+    entries: list[Entry] = []
+    for i in range(8):
+        entry = Entry(title=f"Entry {i}", content=f"Content {i}", user=user)
+        entry.tags = tags[: i % 3]
+        entries.append(entry)
+    db.session.add_all(entries)
+    db.session.commit()
+    for i, entry in enumerate(entries):
+        db.session.execute(
+            text("UPDATE entry SET created_at = :c WHERE id = :id"),
+            {"c": f"2024-01-0{i % 4 + 1} 00:00:00", "id": entry.id},
+        )
+    entries[-1].delete()
+    db.session.commit()
+    return entries
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_entry_count(user: User, journal: list[Entry]) -> None:
+    assert dashboard.entry_count(user) == 7
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_recent_entries(db: SQLAlchemy, user: User, journal: list[Entry]) -> None:
+    # created_at desc with the highest id first for equal timestamps
+    live = sorted(
+        ((i % 4, entry.id, i) for i, entry in enumerate(journal[:-1])), reverse=True
+    )
+    db.session.expire_all()
+    entries = dashboard.recent_entries(user)
+
+    assert [e.title for e in entries] == [f"Entry {i}" for _, _, i in live[:5]]
+    assert sorted(t.name for t in entries[1].tags) == sorted(
+        ["b", "a"][: live[1][2] % 3]
+    )
+    assert "updated_at" not in entries[0].__dict__
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.parametrize("materialized", [False, True], ids=["grouped", "materialized"])
+def test_tag_counts(
+    app: Flask,
+    db: SQLAlchemy,
+    user: User,
+    journal: list[Entry],
+    monkeypatch: pytest.MonkeyPatch,
+    materialized: bool,
+) -> None:
+    monkeypatch.setitem(app.config, "MATERIALIZED_TAG_COUNTS", materialized)
+    Tag.find_by_attr("name", "b").delete()
+    db.session.commit()
+
+    assert [tuple(row[1:]) for row in dashboard.tag_counts(user)] == [
+        ("a", 2),
+        ("unused", 0),
+    ]
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_tag_entry_count_maintained(db: SQLAlchemy, user: User) -> None:
+    a, b = Tag(name="a", user=user), Tag(name="b", user=user)
+    first = Entry(title="first", user=user, tags=[a, b])
+    second = Entry(title="second", user=user, tags=[a])
+    db.session.add_all([a, b, first, second])
+    db.session.commit()
+    assert (a.entry_count, b.entry_count) == (2, 1)
+
+    first.tags.remove(b)
+    db.session.commit()
+    assert (a.entry_count, b.entry_count) == (2, 0)
+
+    second_id = second.id
+    second.delete()
+    db.session.commit()
+    assert (a.entry_count, b.entry_count) == (1, 0)
+
+    db.session.scalar(
+        select(Entry).filter_by(id=second_id).execution_options(include_deleted=True)
+    ).undelete()
+    db.session.commit()
+    assert (a.entry_count, b.entry_count) == (2, 0)
+
+    db.session.delete(first)
+    db.session.commit()
+    assert (a.entry_count, b.entry_count) == (1, 0)
@@ -0,0 +1,54 @@
+import base64
+
+import pytest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import select
+
+from flask_journal.models import Entry, User
+from flask_journal.models.entry import StorageFormat, decode_data, encode_data
+
+
+@pytest.mark.parametrize(
+    ("threshold", "value", "storage"),
+    [
+        (None, "a" * 1000, StorageFormat.text),
+        (100, "short", StorageFormat.text),
+        (100, "a" * 1000, StorageFormat.zlib),
+        (10, "incompressible?", StorageFormat.text),
+    ],
+    ids=["disabled", "below", "above", "larger"],
+)
+def test_encode_data(
+    app: Flask,
+    monkeypatch: pytest.MonkeyPatch,
+    threshold: int | None,
+    value: str,
+    storage: StorageFormat,
+) -> None:
+    monkeypatch.setitem(app.config, "ENTRY_COMPRESS_THRESHOLD", threshold)
+    data, result = encode_data(value)
+
+    assert result == storage
+    assert decode_data(data, result) == value
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_legacy_entry_converted_on_write(db: SQLAlchemy, user: User) -> None:
+    entry = Entry(
+        user=user,
+        _title=base64.b64encode("Tïtle".encode()).decode(),
+        _data=base64.b64encode(b"Body").decode(),
+        storage=StorageFormat.base64,
+    )
+    db.session.add(entry)
+    db.session.commit()
+    assert (entry.title, entry.content) == ("Tïtle", "Body")
+    assert db.session.scalar(select(Entry.title).filter_by(id=entry.id)) is None
+
+    entry.title = "New title"
+    db.session.commit()
+
+    assert (entry._title, entry._data, entry.storage) == ("New title", "Body", "text")
+    assert (entry.title, entry.content) == ("New title", "Body")
+    assert db.session.scalar(select(Entry.title).filter_by(id=entry.id)) == "New title"
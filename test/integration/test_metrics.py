@@ -1,7 +1,16 @@
+from pathlib import Path
+
 import pytest
 from flask.testing import FlaskClient
+from prometheus_client import REGISTRY
 
 from flask_journal import __version__ as APP_VERSION
+from flask_journal.app import create_app
+from flask_journal.config import Config
+from flask_journal.metrics import InstrumentedQueuePool
+from flask_journal.models import db
+
+from ..config import test_config
 
 
 def test_app_info(client: FlaskClient) -> None:
@@ -17,3 +26,44 @@ def test_http_request(client: FlaskClient) -> None:
         'flask_http_request_total{method="GET",status="%d"} 1.0' % r1.status_code
         in rv.text
     )
+
+
+def test_pool_metrics(tmp_path: Path) -> None:
+    app = create_app(
+        Config(
+            mapping={
+                **test_config,
+                "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'journal.db'}",
+                "WORKER_THREADS": 3,
+            }
+        )
+    )
+    with app.app_context():
+        assert isinstance(db.engine.pool, InstrumentedQueuePool)
+        assert db.engine.pool.size() == 3
+        assert db.engine.pool._max_overflow == 3
+
+        waits = REGISTRY.get_sample_value(
+            "journal_db_pool_wait_seconds_count", {"bind": "default"}
+        )
+        with db.engine.connect():
+            assert (
+                REGISTRY.get_sample_value(
+                    "journal_db_pool_checked_out", {"bind": "default"}
+                )
+                == 1
+            )
+        assert (
+            REGISTRY.get_sample_value(
+                "journal_db_pool_checked_out", {"bind": "default"}
+            )
+            == 0
+        )
+        assert (
+            REGISTRY.get_sample_value(
+                "journal_db_pool_wait_seconds_count", {"bind": "default"}
+            )
+            == (waits or 0) + 1
+        )
+        db.session.remove()
+        db.engine.dispose()
@@ -0,0 +1,66 @@
+import typing as t
+
+import pytest
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import Select
+
+from flask_journal import models
+from flask_journal.models import Entry, Tag, User
+from flask_journal.views.utils import build_select
+
+
+def query_plan(db: SQLAlchemy, stmt: Select) -> list[str]:
+    """Details of the sqlite query plan of `stmt` with the soft delete criteria."""
+    if not stmt.get_execution_options().get("include_deleted", False):
+        stmt = stmt.options(*models.soft_delete_criteria)
+    compiled = stmt.compile(db.engine)
+    params = tuple(compiled.params[name] for name in compiled.positiontup or [])
+    with db.engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)
+        return [row[-1] for row in rows]
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.parametrize(
+    ("model", "order", "index"),
+    [
+        (Entry, Entry.created_at.desc(), "ix_entry_owner_created"),
+        (Entry, Entry.id, "ix_entry_owner_created"),
+        (Tag, Tag.name, "ix_tag_owner_name"),
+    ],
+    ids=["entry-created_at", "entry-id", "tag-name"],
+)
+@pytest.mark.usefixtures("logged_in_user_context")
+def test_owned_select_uses_index(
+    db: SQLAlchemy, user: User, model: t.Any, order: t.Any, index: str
+) -> None:
+    plan = query_plan(db, build_select(model, shared=False).order_by(order))
+
+    assert any(index in detail for detail in plan), plan
+    assert not any(detail.startswith("SCAN") for detail in plan), plan
+    if order is not Entry.id:
+        assert not any("TEMP B-TREE" in detail for detail in plan), plan
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.usefixtures("logged_in_user_context")
+def test_tag_entries_use_index(db: SQLAlchemy, user: User) -> None:
+    stmt = build_select(Entry, shared=False).where(
+        Entry.tags.any(Tag.id == 1)  # pyright: ignore
+    )
+    plan = query_plan(db, stmt)
+
+    assert not any(detail.startswith("SCAN entry_tags") for detail in plan), plan
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.parametrize("shared", [True, None], ids=["shared", "default"])
+@pytest.mark.usefixtures("logged_in_user_context")
+def test_shared_select_uses_index(
+    db: SQLAlchemy, user: User, shared: bool | None
+) -> None:
+    plan = query_plan(db, build_select(Entry, shared=shared))
+
+    assert any("ix_shared_entry_user_id" in detail for detail in plan), plan
+    assert not any(detail.startswith("SCAN shared_entry") for detail in plan), plan
+    assert not any(detail.startswith("SCAN user") for detail in plan), plan
@@ -0,0 +1,91 @@
+import shutil
+import time
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from flask import Flask
+from prometheus_client import REGISTRY
+from sqlalchemy import func, select
+
+from flask_journal.app import create_app
+from flask_journal.config import Config
+from flask_journal.models import Entry, User, db
+from flask_journal.models.routing import LAST_WRITE_KEY
+
+from ..config import test_config
+
+
+@pytest.fixture
+def replica_app(tmp_path: Path) -> Generator[Flask, None, None]:
+    primary, replica = tmp_path / "primary.db", tmp_path / "replica.db"
+    app = create_app(
+        Config(
+            mapping={
+                **test_config,
+                "SQLALCHEMY_DATABASE_URI": f"sqlite:///{primary}",
+                "SQLALCHEMY_REPLICAS": [f"sqlite:///{replica}"],
+                "REPLICA_READ_YOUR_WRITES": 5,
+            }
+        )
+    )
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(email="a@example.test", password="a"))
+        db.session.commit()
+        db.session.remove()
+        shutil.copy(primary, replica)
+        # Only on the primary, the replica lags behind
+        db.session.add(Entry(title="new", user_id=1))
+        db.session.commit()
+        db.session.remove()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+        for engine in app.extensions["journal_replicas"].values():
+            engine.dispose()
+
+
+def entry_count() -> int:
+    return db.session.scalar(select(func.count(Entry.id)))
+
+
+def replica_queries() -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "journal_db_query_seconds_count", {"bind": "replica_0"}
+        )
+        or 0
+    )
+
+
+def test_get_reads_replica(replica_app: Flask) -> None:
+    before = replica_queries()
+    with replica_app.test_request_context(method="GET"):
+        assert entry_count() == 0
+    assert replica_queries() == before + 1
+
+    with replica_app.test_request_context(method="POST"):
+        assert entry_count() == 1
+
+
+def test_read_your_writes(replica_app: Flask, monkeypatch: pytest.MonkeyPatch) -> None:
+    with replica_app.test_request_context(method="GET") as ctx:
+        db.session.add(Entry(title="flushed", user_id=1))
+        db.session.flush()
+        assert entry_count() == 2
+        db.session.commit()
+        assert LAST_WRITE_KEY in ctx.session
+
+        # Within the window reads stay on the primary
+        assert entry_count() == 2
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 10)
+        assert entry_count() == 0
+
+
+def test_no_replicas(app: Flask) -> None:
+    assert app.extensions["journal_replicas"] == {}
+    with app.test_request_context(method="GET"):
+        assert db.session.get_bind(clause=select(Entry)) is db.engine
@@ -1,3 +1,4 @@
+import typing as t
 from datetime import datetime
 
 import pytest
@@ -8,6 +9,8 @@ from flask_security.forms import ConfirmRegisterForm
 from flask_security.recoverable import generate_reset_password_token
 from flask_security.registerable import register_user
 from flask_security.utils import verify_and_update_password
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 
 from flask_journal.models import Role as SecurityRole
 from flask_journal.models import User as SecurityUser
@@ -276,3 +279,27 @@ def test_user_init_handler_existing_role(app: Flask, emptydatastore: datastore)
 
     assert u.settings is not None
     assert u.has_role("user")
+
+
+def test_has_role_cached(db: SQLAlchemy, userdatastore: datastore) -> None:
+    user: SecurityUser = userdatastore.find_user(email="user2@example.test")
+    statements: list[str] = []
+
+    def before_execute(
+        conn: t.Any, cursor: t.Any, statement: str, *args: t.Any
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_execute)
+    try:
+        assert user.has_role("manage")
+        db.session.commit()  # expires the roles
+        assert user.has_role("manage") and not user.has_role("admin")
+        assert not statements
+
+        userdatastore.add_role_to_user(user, "admin")
+        assert user.has_role(SecurityRole.find_by_name("admin"))
+        userdatastore.remove_role_from_user(user, "manage")
+        assert not user.has_role("manage")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_execute)
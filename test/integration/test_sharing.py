@@ -0,0 +1,54 @@
+import pytest
+from flask import Flask, g
+from flask_security.datastore import UserDatastore
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import Select, select
+
+from flask_journal.models import Entry, User
+from flask_journal.views.utils import build_select
+
+
+@pytest.fixture
+def shared_entries(db: SQLAlchemy, userdatastore: UserDatastore) -> list[User]:
+    users: list[User] = list(db.session.scalars(select(User).order_by(User.id)))
+    for i in range(30):
+        entry = Entry(title=f"Entry {i}", user=users[i % len(users)])
+        entry.shared_with = [u for j, u in enumerate(users) if (i + j) % 4 == 0]
+        db.session.add(entry)
+    db.session.commit()
+    return users
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.parametrize("shared", [True, None], ids=["shared", "default"])
+@pytest.mark.usefixtures("logged_in_user_context", "shared_entries")
+def test_shared_with_user_matches_any(
+    db: SQLAlchemy, user: User, shared: bool | None
+) -> None:
+    exp = Entry.shared_with.any(Entry.shared_with.contains(user))
+    if shared is None:
+        exp = exp | (Entry.user == user)
+    expected = select(Entry.id).where(exp)
+    ids = {e.id for e in db.session.scalars(build_select(Entry, shared=shared))}
+
+    assert ids
+    assert ids == set(db.session.scalars(expected))
+
+
+@pytest.mark.usefixtures("shared_entries")
+def test_build_select_reused_between_users(app: Flask, db: SQLAlchemy) -> None:
+    users: list[User] = list(db.session.scalars(select(User).order_by(User.id)))
+    statements: list[Select] = []
+    for user in (users[0], users[2]):
+        with app.test_request_context():
+            g._login_user = user
+            stmt = build_select(Entry)
+            ids = set(db.session.scalars(stmt.with_only_columns(Entry.id)))
+            assert ids == {
+                e.id
+                for e in db.session.scalars(select(Entry))
+                if e.user == user or user in e.shared_with
+            }
+            statements.append(stmt)
+
+    assert statements[0] is statements[1]
@@ -0,0 +1,82 @@
+import pytest
+from flask_security.datastore import UserDatastore
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import aliased
+
+from flask_journal.models import Entry, Tag, User
+from flask_journal.models.tag import EntryTags
+
+EntryAlias = aliased(Entry)
+
+
+@pytest.fixture
+def entries(db: SQLAlchemy, userdatastore: UserDatastore) -> list[int]:
+    """Ids of a live and a soft deleted entry sharing one tag."""
+    user: User = userdatastore.find_user(email="user3@example.test")
+    tag = Tag(name="tag", user=user)
+    db.session.add(tag)
+    live = Entry(title="live", user=user, tags=[tag])
+    deleted = Entry(title="deleted", user=user, tags=[tag])
+    db.session.add_all([live, deleted])
+    db.session.commit()
+    ids = [live.id, deleted.id]
+    deleted.delete()
+    db.session.commit()
+    return ids
+
+
+@pytest.mark.parametrize(
+    "stmt",
+    [
+        select(Entry.id).order_by(Entry.id),
+        select(EntryAlias.id).order_by(EntryAlias.id),
+    ],
+    ids=["select", "aliased"],
+)
+def test_soft_deleted_hidden(db: SQLAlchemy, entries: list[int], stmt: Select) -> None:
+    assert db.session.scalars(stmt).all() == entries[:1]
+    assert (
+        db.session.scalars(stmt.execution_options(include_deleted=True)).all()
+        == entries
+    )
+
+
+@pytest.mark.parametrize(
+    "stmt",
+    [
+        select(func.count()).select_from(select(Entry.id).subquery()),
+        select(func.count()).select_from(EntryTags).join(Entry),
+    ],
+    ids=["subquery", "join"],
+)
+@pytest.mark.usefixtures("entries")
+def test_soft_deleted_not_counted(db: SQLAlchemy, stmt: Select) -> None:
+    assert db.session.scalar(stmt) == 1
+    assert db.session.scalar(stmt.execution_options(include_deleted=True)) == 2
+
+
+def test_soft_deleted_hidden_from_relationships(
+    db: SQLAlchemy, entries: list[int]
+) -> None:
+    db.session.expunge_all()
+    tag: Tag = db.session.scalar(select(Tag))
+
+    assert [entry.id for entry in tag.entries] == entries[:1]
+
+
+def test_find_inactive_user(userdatastore: UserDatastore) -> None:
+    user: User = userdatastore.find_user(email="user4@example.test")
+
+    assert user is not None
+    assert not user.active
+    assert userdatastore.find_user(case_insensitive=True, email="USER4@example.test")
+
+
+def test_soft_deleted_tag_names(db: SQLAlchemy, entries: list[int]) -> None:
+    stmt = select(Entry.tag_names).where(Entry.id == entries[0])
+    assert db.session.scalar(stmt) == "tag"
+
+    db.session.scalar(select(Tag)).delete()
+    db.session.commit()
+    assert db.session.scalar(stmt) == ""
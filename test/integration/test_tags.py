@@ -0,0 +1,79 @@
+import typing as t
+
+import pytest
+from flask_security.datastore import UserDatastore
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, select
+
+from flask_journal.models import Entry, Tag, User
+from flask_journal.models.tag import _insert_missing, find_or_create_tags
+
+
+@pytest.fixture
+def owner(db: SQLAlchemy, userdatastore: UserDatastore) -> int:
+    """Id of a user with tags used by entries, one of the tags soft deleted."""
+    user: User = userdatastore.find_user(email="user3@example.test")
+    tags = [Tag(name=name, user=user) for name in ("a", "b", "deleted")]
+    db.session.add_all(tags)
+    for _ in range(3):
+        db.session.add(Entry(title="T", user=user, tags=tags))
+    db.session.commit()
+    user_id = user.id
+    tags[2].delete()
+    db.session.commit()
+    db.session.expunge_all()
+    return user_id
+
+
+@pytest.fixture
+def statements(db: SQLAlchemy) -> t.Generator[list[str], None, None]:
+    statements: list[str] = []
+
+    def before_execute(
+        conn: t.Any, cursor: t.Any, statement: str, *args: t.Any
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_execute)
+
+
+@pytest.mark.parametrize(
+    ("names", "queries"),
+    [
+        ([], 0),
+        (["a", "b", "a"], 1),
+        (["new", "a", "other", "new"], 3),
+    ],
+    ids=["empty", "existing", "new"],
+)
+def test_find_or_create_tags(
+    db: SQLAlchemy,
+    owner: int,
+    statements: list[str],
+    names: list[str],
+    queries: int,
+) -> None:
+    tags = find_or_create_tags(db.session, owner, names)
+
+    assert [tag.name for tag in tags] == list(dict.fromkeys(names))
+    assert all(tag.user_id == owner and tag.id for tag in tags)
+    assert len(statements) == queries
+    assert not [s for s in statements if "FROM entry" in s]
+
+
+def test_find_or_create_tags_restores_deleted(db: SQLAlchemy, owner: int) -> None:
+    (tag,) = find_or_create_tags(db.session, owner, ["deleted"])
+    db.session.commit()
+
+    assert tag.active
+    assert db.session.scalar(select(Tag).filter_by(name="deleted")) is tag
+
+
+def test_insert_missing_ignores_existing(db: SQLAlchemy, owner: int) -> None:
+    rows = [{"name": "a", "user_id": owner}, {"name": "c", "user_id": owner}]
+    db.session.execute(_insert_missing(db.session), rows)
+
+    names = db.session.scalars(select(Tag.name).filter_by(user_id=owner))
+    assert sorted(names) == ["a", "b", "c"]
@@ -0,0 +1,134 @@
+from datetime import datetime
+
+import pytest
+from flask import g
+from flask.testing import FlaskClient
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import update
+
+from flask_journal.models import Entry, Tag, User
+
+
+def add_entries(db: SQLAlchemy, user: User, n: int) -> list[Entry]:
+    tag = Tag(name="api", user=user)
+    entries = [Entry(title=f"Entry {i}", user=user, tags=[tag]) for i in range(n)]
+    db.session.add_all(entries)
+    db.session.commit()
+    # distinct, settled timestamps so pages are ordered and get validators
+    for i, entry in enumerate(entries):
+        db.session.execute(
+            update(Entry)
+            .where(Entry.id == entry.id)
+            .values(created_at=datetime(2024, 1, 1, 0, i), updated_at=None)
+        )
+    db.session.execute(
+        update(Tag).values(created_at=datetime(2024, 1, 1), updated_at=None)
+    )
+    db.session.commit()
+    return entries
+
+
+def test_unauthenticated(client: FlaskClient, db: SQLAlchemy) -> None:
+    rv = client.get("/api/v1/entries")
+
+    assert rv.status_code == 401
+    assert rv.json["error"] == "Unauthorized"
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_entries_pages(
+    logged_in_user_client: FlaskClient, user: User, db: SQLAlchemy
+) -> None:
+    add_entries(db, user, 5)
+
+    first = logged_in_user_client.get("/api/v1/entries?limit=2").json
+    assert [e["title"] for e in first["items"]] == ["Entry 4", "Entry 3"]
+    assert first["items"][0]["tags"] == ["api"]
+    assert first["items"][0]["user_id"] == user.id
+    assert first["items"][0]["created_at"].startswith("2024-01-01T00:04")
+    assert first["prev"] is None
+
+    second = logged_in_user_client.get(first["next"]).json
+    assert [e["title"] for e in second["items"]] == ["Entry 2", "Entry 1"]
+
+    back = logged_in_user_client.get(second["prev"]).json
+    assert back["items"] == first["items"]
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_sparse_fields(
+    logged_in_user_client: FlaskClient, user: User, db: SQLAlchemy
+) -> None:
+    entry = add_entries(db, user, 1)[0]
+
+    rv = logged_in_user_client.get("/api/v1/entries?fields=title,id")
+    assert rv.json["items"] == [{"id": entry.id, "title": "Entry 0"}]
+
+    rv = logged_in_user_client.get(f"/api/v1/entries/{entry.id}?fields=tags")
+    assert rv.json == {"tags": ["api"]}
+
+    rv = logged_in_user_client.get("/api/v1/tags?fields=name,entry_count")
+    assert rv.json["items"] == [{"name": "api", "entry_count": 1}]
+
+    rv = logged_in_user_client.get("/api/v1/entries?fields=title,password")
+    assert rv.status_code == 400
+    assert "password" in rv.json["message"]
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.parametrize(
+    "url",
+    ["/api/v1/entries?limit=0", "/api/v1/entries?after=garbage", "/api/v1/tags/999"],
+    ids=["limit", "cursor", "missing"],
+)
+def test_errors(
+    logged_in_user_client: FlaskClient, user: User, db: SQLAlchemy, url: str
+) -> None:
+    rv = logged_in_user_client.get(url)
+
+    assert rv.status_code in (400, 404)
+    assert rv.is_json and "error" in rv.json
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_shared_entries(
+    client: FlaskClient, userdatastore: object, user: User, db: SQLAlchemy
+) -> None:
+    owner = db.session.get(User, 1)
+    entry = add_entries(db, owner, 2)[0]
+    entry.shared_with.append(user)
+    db.session.commit()
+    headers = {"Authentication-Token": user.get_auth_token()}
+    # g outlives requests in the app context of the tests, forget earlier users
+    g.pop("_login_user", None)
+
+    rv = client.get("/api/v1/entries/shared?fields=id,shared_with", headers=headers)
+    assert rv.json["items"] == [{"id": entry.id, "shared_with": [user.id]}]
+    assert client.get("/api/v1/entries", headers=headers).json["items"] == []
+    assert client.get(f"/api/v1/entries/{entry.id}", headers=headers).status_code == 200
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_not_modified(
+    logged_in_user_client: FlaskClient, user: User, db: SQLAlchemy
+) -> None:
+    entry = add_entries(db, user, 2)[0]
+
+    for url in ["/api/v1/entries", f"/api/v1/entries/{entry.id}", "/api/v1/tags"]:
+        rv = logged_in_user_client.get(url)
+        assert rv.headers["ETag"]
+        rv = logged_in_user_client.get(
+            url, headers={"If-None-Match": rv.headers["ETag"]}
+        )
+        assert rv.status_code == 304
+
+    rv = logged_in_user_client.get("/api/v1/entries")
+    entry.title = "Changed"
+    db.session.commit()
+    db.session.execute(update(Entry).values(updated_at=datetime(2024, 2, 1)))
+    db.session.commit()
+    rv = logged_in_user_client.get(
+        "/api/v1/entries", headers={"If-None-Match": rv.headers["ETag"]}
+    )
+    assert rv.status_code == 200
+    assert "Changed" in rv.text
@@ -0,0 +1,70 @@
+import re
+from typing import Generator
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+
+from flask_journal.app import create_app
+from flask_journal.config import Config
+from flask_journal.models import db
+from flask_journal.views.themes import Theme, local_theme_url
+
+from ...config import test_config
+
+
+@pytest.fixture
+def offline_app() -> Generator[Flask, None, None]:
+    app = create_app(Config(mapping={**test_config, "OFFLINE_ASSETS": True}))
+    with app.app_context():
+        yield app
+        db.session.remove()
+
+
+def asset_urls(html: str) -> list[str]:
+    return re.findall(r'(?:href|src)="(/bootstrap/static/[^"]+)"', html)
+
+
+def test_cdn_preload(client: FlaskClient) -> None:
+    rv = client.get("/auth/login")
+    assert "<https://cdn.jsdelivr.net/npm/bootstrap@" in rv.headers["Link"]
+    assert "rel=preload; as=style" in rv.headers["Link"]
+
+
+def test_offline_assets(offline_app: Flask) -> None:
+    client = offline_app.test_client()
+    rv = client.get("/auth/login")
+    urls = asset_urls(rv.text)
+    css = [url for url in urls if url.endswith(".css")]
+    assert re.fullmatch(
+        r"/bootstrap/static/css/bootstrap\.min\.[0-9a-f]{12}\.css", css[0]
+    )
+    assert any(url.endswith(".js") for url in urls)
+    assert rv.headers["Link"] == f"<{css[0]}>; rel=preload; as=style"
+    assert "cdn.jsdelivr.net" not in rv.text
+
+    for url in urls:
+        asset = client.get(url)
+        assert asset.status_code == 200
+        assert asset.cache_control.immutable
+        assert asset.cache_control.max_age == 365 * 24 * 3600
+        asset.close()
+
+
+def test_offline_asset_changed(offline_app: Flask) -> None:
+    client = offline_app.test_client()
+    rv = client.get("/bootstrap/static/css/bootstrap.min.0123456789ab.css")
+    assert rv.status_code == 200
+    assert not rv.cache_control.immutable
+    rv.close()
+
+
+@pytest.mark.parametrize("theme", [t for t in Theme if t != "default"])
+def test_offline_themes(offline_app: Flask, theme: Theme) -> None:
+    with offline_app.test_request_context():
+        url = local_theme_url(theme, "bootstrap.min.css")
+    assert f"/bootswatch/{theme}/" in url
+    rv = offline_app.test_client().get(url)
+    assert rv.status_code == 200
+    assert rv.cache_control.immutable
+    rv.close()
@@ -0,0 +1,66 @@
+import pytest
+from flask.testing import FlaskClient
+
+from flask_journal.models import User
+
+
+def choices(client: FlaskClient, name: str, **args: str | int) -> dict:
+    rv = client.get(f"/api/choices/{name}", query_string=args)
+    assert rv.status_code == 200
+    return rv.json
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.parametrize(
+    ("q", "expected"),
+    [
+        ("", ["user1", "user2", "user5"]),
+        ("USER1", ["user1"]),
+        ("user4", []),
+        ("%", []),
+    ],
+    ids=["all", "prefix", "inactive", "escaped"],
+)
+def test_user_choices(
+    logged_in_user_client: FlaskClient, user: User, q: str, expected: list[str]
+) -> None:
+    data = choices(logged_in_user_client, "user", q=q)
+
+    assert [r["text"] for r in data["results"]] == [
+        f"{name}@example.test" for name in expected
+    ]
+    assert not data["more"]
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_user_choices_pages(logged_in_user_client: FlaskClient, user: User) -> None:
+    first = choices(logged_in_user_client, "user", limit=2)
+    second = choices(logged_in_user_client, "user", limit=2, page=2)
+
+    assert first["more"] and not second["more"]
+    assert len(first["results"]) == 2 and len(second["results"]) == 1
+
+
+def test_role_choices(logged_in_user_client: FlaskClient, user: User) -> None:
+    rv = logged_in_user_client.get("/api/choices/role", query_string={"q": "ma"})
+    if user.has_role("admin"):
+        assert rv.status_code == 200
+        assert rv.json["results"] == [{"id": 2, "text": "manage"}]
+    else:
+        assert rv.status_code == 403
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_unknown_choices(logged_in_user_client: FlaskClient, user: User) -> None:
+    assert logged_in_user_client.get("/api/choices/entry").status_code == 404
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_entry_form_renders_selected_users(
+    logged_in_user_client: FlaskClient, user: User
+) -> None:
+    rv = logged_in_user_client.get("/entry")
+
+    assert 'data-typeahead="/api/choices/user"' in rv.text
+    assert 'id="Shared With-search"' in rv.text
+    assert "<option" not in rv.text.split('id="Shared With"')[1].split("</select>")[0]
@@ -1,4 +1,10 @@
+import html
+import re
+import typing as t
+
 import pytest
+from flask import Flask
+from sqlalchemy import event, select, text
 from flask.testing import FlaskClient
 from flask_sqlalchemy import SQLAlchemy
 
@@ -130,7 +136,8 @@ def test_entry_create_post(
     entry = models.Entry.query.first()  # LegacyQuery
     assert isinstance(entry, models.Entry)
     assert entry.content == expected_body
-    assert entry.content != entry._data
+    assert entry._data == expected_body
+    assert entry.storage == "text"
     for tag in expected_tags:
         t = models.Tag.query.filter_by(name=tag, user=user).first()  # LegacyQuery
         assert isinstance(t, models.Tag)
@@ -229,3 +236,187 @@ def test_entry_view_post(
         case "Edit":
             assert rv.status_code == 200
             assert html_test_strings["title"] % "Edit Entry" in rv.text
+
+
+@pytest.fixture
+def keyset_entries(
+    app: Flask, user: models.User, db: SQLAlchemy, monkeypatch: pytest.MonkeyPatch
+) -> list[str]:
+    monkeypatch.setitem(app.config, "KEYSET_PAGINATION", True)
+    for i in range(25):
+        db.session.add(models.Entry(title=f"KeysetEntry {i:02d}", user=user))
+    db.session.commit()
+    # server generated timestamps shared by every row, as stored by sqlite
+    db.session.execute(text("UPDATE entry SET created_at = '2024-01-01 00:00:00'"))
+    db.session.commit()
+    return [f"KeysetEntry {i:02d}" for i in reversed(range(25))]
+
+
+def pager_links(rv_text: str) -> dict[str, str]:
+    return {
+        direction: html.unescape(url)
+        for url, direction in re.findall(
+            r'href="\s*(/entries\?[^"]*(after|before)=[^"]+)"', rv_text
+        )
+    }
+
+
+def follow_pages(
+    client: FlaskClient, url: str, direction: str
+) -> list[tuple[list[str], dict[str, str]]]:
+    pages: list[tuple[list[str], dict[str, str]]] = []
+    for _ in range(10):
+        rv = client.get(url)
+        assert rv.status_code == 200
+        links = pager_links(rv.text)
+        pages.append((re.findall(r"KeysetEntry \d{2}", rv.text), links))
+        if direction not in links:
+            return pages
+        url = links[direction]
+    raise AssertionError("pagination did not end after %d pages" % len(pages))
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_entries_view_keyset(
+    logged_in_user_client: FlaskClient, keyset_entries: list[str]
+) -> None:
+    pages = follow_pages(logged_in_user_client, "/entries?page_size=10", "after")
+    seen = [title for titles, _ in pages for title in titles]
+
+    assert len(pages) == 3
+    assert len(seen) == len(set(seen))
+    assert seen == keyset_entries
+    assert "before" not in pages[0][1]
+    assert "before" in pages[-1][1]
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_entries_view_keyset_before(
+    logged_in_user_client: FlaskClient, keyset_entries: list[str]
+) -> None:
+    forward = follow_pages(logged_in_user_client, "/entries?page_size=10", "after")
+    backward = follow_pages(logged_in_user_client, forward[-1][1]["before"], "before")
+
+    assert [titles for titles, _ in backward] == [
+        titles for titles, _ in reversed(forward[:-1])
+    ]
+    first_page_links = backward[-1][1]
+    assert "before" not in first_page_links
+    assert "after" in first_page_links
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_entries_view_keyset_out_of_range(
+    logged_in_user_client: FlaskClient, keyset_entries: list[str], db: SQLAlchemy
+) -> None:
+    forward = follow_pages(logged_in_user_client, "/entries?page_size=10", "after")
+    db.session.execute(
+        text("DELETE FROM entry WHERE id IN (SELECT id FROM entry ORDER BY id LIMIT 5)")
+    )
+    db.session.commit()
+
+    rv = logged_in_user_client.get(forward[-2][1]["after"])
+    assert rv.status_code == 200
+    assert re.findall(r"KeysetEntry \d{2}", rv.text) == keyset_entries[10:20]
+    assert set(pager_links(rv.text)) == {"before"}
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.parametrize(
+    ("query", "status_code"),
+    [
+        ("after=invalid", 400),
+        ("after=W0luZmluaXR5XQ", 400),
+        ("after=WzFd&before=WzFd", 400),
+        ("page_size=0", 404),
+        ("page_size=-5", 404),
+    ],
+    ids=["garbage", "infinity", "after-and-before", "zero", "negative"],
+)
+def test_entries_view_keyset_invalid(
+    logged_in_user_client: FlaskClient,
+    keyset_entries: list[str],
+    query: str,
+    status_code: int,
+) -> None:
+    rv = logged_in_user_client.get("/entries?%s" % query)
+    assert rv.status_code == status_code
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.parametrize("url", ["/entries", "/entries/shared"], ids=["own", "shared"])
+def test_entries_view_loads_listed_columns(
+    logged_in_user_client: FlaskClient,
+    user: models.User,
+    db: SQLAlchemy,
+    url: str,
+) -> None:
+    owner = db.session.scalar(select(models.User).filter_by(email="user1@example.test"))
+    statements: list[str] = []
+
+    def before_execute(
+        conn: t.Any, cursor: t.Any, statement: str, *args: t.Any
+    ) -> None:
+        statements.append(statement)
+
+    def add_entries(n: int) -> int:
+        for _ in range(n):
+            db.session.add(models.Entry(title="T", content="x" * 1000, user=user))
+            db.session.add(
+                models.Entry(title="T", content="x", user=owner, shared_with=[user])
+            )
+        db.session.commit()
+        statements.clear()
+        rv = logged_in_user_client.get(url)
+        assert rv.status_code == 200
+        return len(statements)
+
+    event.listen(db.engine, "before_cursor_execute", before_execute)
+    try:
+        assert add_entries(2) == add_entries(8)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_execute)
+    assert not [s for s in statements if "entry._data" in s]
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.parametrize("url", ["/entries", "/entries/shared"], ids=["own", "shared"])
+def test_entries_view_query_count_constant(
+    logged_in_user_client: FlaskClient,
+    user: models.User,
+    db: SQLAlchemy,
+    url: str,
+) -> None:
+    owner = db.session.scalar(select(models.User).filter_by(email="user1@example.test"))
+    tags = {
+        u: [models.Tag(name=f"tag{i}", user=u) for i in range(3)] for u in (user, owner)
+    }
+    db.session.add_all([tag for user_tags in tags.values() for tag in user_tags])
+    for i in range(12):
+        db.session.add(models.Entry(title="T", user=user, tags=tags[user][: i % 4]))
+        db.session.add(
+            models.Entry(
+                title="T", user=owner, tags=tags[owner][: i % 4], shared_with=[user]
+            )
+        )
+    db.session.commit()
+    statements: list[str] = []
+
+    def before_execute(
+        conn: t.Any, cursor: t.Any, statement: str, *args: t.Any
+    ) -> None:
+        statements.append(statement)
+
+    def count(page_size: int) -> int:
+        statements.clear()
+        rv = logged_in_user_client.get(url, query_string={"page_size": page_size})
+        assert rv.status_code == 200
+        assert b"tag0 tag1 tag2" in rv.data
+        return len(statements)
+
+    event.listen(db.engine, "before_cursor_execute", before_execute)
+    try:
+        count(4)  # loads the logged in user
+        assert count(4) == count(12)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_execute)
@@ -0,0 +1,126 @@
+import typing as t
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from flask.testing import FlaskClient
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, update
+
+from flask_journal import models
+from flask_journal.views import etag
+
+
+@pytest.fixture
+def entry(user: models.User, db: SQLAlchemy, monkeypatch: pytest.MonkeyPatch) -> int:
+    # Validate rows changed in the current second, changes below set new values
+    monkeypatch.setattr(etag, "FRESH", timedelta(0))
+    entry = models.Entry(title="Title", content="Body", user=user)
+    db.session.add(entry)
+    db.session.commit()
+    return entry.id
+
+
+@pytest.fixture
+def statements(db: SQLAlchemy) -> t.Generator[list[str], None, None]:
+    statements: list[str] = []
+
+    def before_execute(
+        conn: t.Any, cursor: t.Any, statement: str, *args: t.Any
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_execute)
+
+
+def revalidate(client: FlaskClient, url: str, etag: str) -> int:
+    return client.get(url, headers={"If-None-Match": etag}).status_code
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_entry_not_modified(
+    logged_in_user_client: FlaskClient, entry: int, statements: list[str]
+) -> None:
+    url = f"/entry?id={entry}"
+    rv = logged_in_user_client.get(url)
+    assert rv.status_code == 200
+    assert rv.headers["ETag"].startswith('W/"')
+    assert rv.last_modified is not None
+    assert "no-cache" in rv.headers["Cache-Control"]
+
+    statements.clear()
+    assert revalidate(logged_in_user_client, url, rv.headers["ETag"]) == 304
+    assert not [s for s in statements if "entry._data" in s]
+
+    logged_in_user_client.post(
+        "/entry",
+        data={"id": entry, "Title": "New", "Body": "Body", "Update": "Update"},
+    )
+    assert revalidate(logged_in_user_client, url, rv.headers["ETag"]) == 200
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.parametrize("url", ["/entries", "/entries/shared"], ids=["own", "shared"])
+def test_entries_not_modified(
+    logged_in_user_client: FlaskClient,
+    user: models.User,
+    db: SQLAlchemy,
+    entry: int,
+    url: str,
+) -> None:
+    rv = logged_in_user_client.get(url)
+    assert revalidate(logged_in_user_client, url, rv.headers["ETag"]) == 304
+    assert (
+        revalidate(logged_in_user_client, f"{url}?page_size=5", rv.headers["ETag"])
+        == 200
+    )
+
+    owner = models.User.find_by_attr(models.User.email, "user1@example.test")
+    db.session.add(models.Entry(title="New", user=owner, shared_with=[user]))
+    db.session.add(models.Entry(title="New", user=user))
+    db.session.commit()
+    assert revalidate(logged_in_user_client, url, rv.headers["ETag"]) == 200
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_tag_changes_validators(
+    logged_in_user_client: FlaskClient,
+    user: models.User,
+    db: SQLAlchemy,
+    entry: int,
+) -> None:
+    tag = models.Tag(name="tag", user=user)
+    db.session.add(tag)
+    db.session.commit()
+    tag_id = tag.id
+
+    rv = logged_in_user_client.get("/entries")
+    db.session.get(models.Entry, entry).tags.append(tag)
+    db.session.commit()
+    assert revalidate(logged_in_user_client, "/entries", rv.headers["ETag"]) == 200
+
+    old = datetime(2000, 1, 1, tzinfo=UTC)
+    db.session.execute(update(models.Entry).values(updated_at=old))
+    db.session.execute(update(models.Tag).values(updated_at=old))
+    db.session.commit()
+    url = f"/tag/{tag_id}/entries"
+    rv = logged_in_user_client.get(url)
+    assert revalidate(logged_in_user_client, url, rv.headers["ETag"]) == 304
+
+    db.session.get(models.Tag, tag_id).name = "renamed"
+    db.session.commit()
+    assert revalidate(logged_in_user_client, url, rv.headers["ETag"]) == 200
+    assert db.session.get(models.Entry, entry).updated_at.year > old.year
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_flashed_messages_not_validated(
+    logged_in_user_client: FlaskClient, entry: int
+) -> None:
+    with logged_in_user_client.session_transaction() as session:
+        session["_flashes"] = [("message", "Pending")]
+    rv = logged_in_user_client.get(f"/entry?id={entry}")
+    assert "Pending" in rv.text
+    assert "ETag" not in rv.headers
+    assert "ETag" in logged_in_user_client.get(f"/entry?id={entry}").headers
@@ -0,0 +1,135 @@
+import typing as t
+from pathlib import Path
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
+from flask_journal import models
+from flask_journal.views import fragments
+
+
+@pytest.fixture
+def backend(app: Flask, monkeypatch: pytest.MonkeyPatch) -> fragments.MemoryBackend:
+    backend = fragments.MemoryBackend(app)
+    monkeypatch.setitem(app.extensions, fragments.EXTENSION_KEY, backend)
+    monkeypatch.setitem(app.config, "FRAGMENT_CACHE_TTL", 60)
+    return backend
+
+
+@pytest.fixture
+def statements(db: SQLAlchemy) -> t.Generator[list[str], None, None]:
+    statements: list[str] = []
+
+    def before_execute(
+        conn: t.Any, cursor: t.Any, statement: str, *args: t.Any
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_execute)
+
+
+def entry_queries(statements: list[str]) -> list[str]:
+    return [s for s in statements if "FROM entry" in s and "count(" not in s]
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.usefixtures("backend")
+def test_home_fragments(
+    logged_in_user_client: FlaskClient,
+    user: models.User,
+    db: SQLAlchemy,
+    statements: list[str],
+) -> None:
+    tag = models.Tag(name="cached", user=user)
+    db.session.add(tag)
+    db.session.add(models.Entry(title="First", user=user, tags=[tag]))
+    db.session.commit()
+
+    rv = logged_in_user_client.get("/home")
+    assert "First" in rv.text and "cached" in rv.text
+    statements.clear()
+
+    assert logged_in_user_client.get("/home").text == rv.text
+    assert not entry_queries(statements)
+
+    db.session.add(models.Entry(title="Second", user=user))
+    db.session.commit()
+    statements.clear()
+    rv = logged_in_user_client.get("/home")
+    assert "Second" in rv.text
+    assert entry_queries(statements)
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.usefixtures("backend")
+def test_tag_entries_fragment(
+    logged_in_user_client: FlaskClient,
+    user: models.User,
+    db: SQLAlchemy,
+    statements: list[str],
+) -> None:
+    tag = models.Tag(name="cached", user=user)
+    db.session.add(models.Entry(title="Tagged", user=user, tags=[tag]))
+    db.session.commit()
+    url = f"/tag/{tag.id}/entries"
+
+    assert "Tagged" in logged_in_user_client.get(url).text
+    statements.clear()
+    assert "Tagged" in logged_in_user_client.get(url).text
+    # only the validator of the conditional request aggregates entries
+    assert not [s for s in statements if "entry_tags" in s and "count(" not in s]
+
+
+def test_fragments_per_user(
+    app: Flask, backend: fragments.MemoryBackend, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[int] = []
+
+    def render() -> str:
+        calls.append(1)
+        return "<p>fragment</p>"
+
+    with app.test_request_context():
+        assert fragments.cached("name", render) == "<p>fragment</p>"
+        assert len(calls) == 1  # anonymous users are not cached
+
+        user = models.User(id=7, email="f@example.test", password="x")
+        monkeypatch.setattr(fragments, "current_user", user)
+        fragments.cached(("name", 1), render)
+        fragments.cached(("name", 1), render)
+        fragments.cached(("name", 2), render)
+        assert len(calls) == 3
+
+        fragments.bump(backend, 7)
+        fragments.cached(("name", 1), render)
+        assert len(calls) == 4
+
+
+def test_filesystem_backend(app: Flask, tmp_path: Path) -> None:
+    app.config["FRAGMENT_CACHE_DIR"] = str(tmp_path)
+    try:
+        backend = fragments.FileSystemBackend(app)
+    finally:
+        app.config["FRAGMENT_CACHE_DIR"] = None
+    backend.set("key", "line\nline", 60)
+    backend.set("expired", "value", -1)
+    backend.set("forever", "value", None)
+
+    assert backend.get("key") == "line\nline"
+    assert backend.get("expired") is None
+    assert backend.get("forever") == "value"
+    assert backend.get("missing") is None
+
+
+def test_load_backend(app: Flask, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(
+        app.config,
+        "FRAGMENT_CACHE_BACKEND",
+        "flask_journal.views.fragments:MemoryBackend",
+    )
+    assert isinstance(fragments.load_backend(app), fragments.MemoryBackend)
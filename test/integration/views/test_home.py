@@ -1,7 +1,8 @@
+import pytest
 from flask.testing import FlaskClient
 from flask_sqlalchemy import SQLAlchemy
 
-from flask_journal.models import Tag, User
+from flask_journal.models import Entry, Tag, User
 
 from ...config import html_test_strings
 
@@ -49,3 +50,28 @@ def test_home_view_authenticated(
         assert html_test_strings["home"]["tag_cloud"] in rv.text
     else:
         assert html_test_strings["home"]["tag_cloud"] not in rv.text
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_home_view_tag_cloud(
+    logged_in_user_client: FlaskClient, user: User, db: SQLAlchemy
+) -> None:
+    tags = [Tag(name=name, user=user) for name in ["often", "rarely", "never"]]
+    db.session.add_all(tags)
+    for i in range(4):
+        db.session.add(Entry(title=f"Entry {i}", user=user, tags=tags[: 1 + i // 3]))
+    db.session.commit()
+
+    rv = logged_in_user_client.get("/home")
+    assert rv.status_code == 200
+    assert (
+        'btn btn-tag-10 btn-primary btn-lg" href="/tag/%d/entries">often' % (tags[0].id)
+        in rv.text
+    )
+    assert (
+        'btn btn-tag-2 btn-secondary btn-sm" href="/tag/%d/entries">rarely'
+        % (tags[1].id)
+        in rv.text
+    )
+    assert "never</a>" not in rv.text
+    assert rv.text.index("Entry 3") < rv.text.index("Entry 0")
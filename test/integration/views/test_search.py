@@ -0,0 +1,104 @@
+import pytest
+from flask.testing import FlaskClient
+from flask_security.datastore import UserDatastore
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import select
+
+from flask_journal.models import Entry, User, search
+
+
+@pytest.fixture(params=[True, False], ids=["fts", "terms"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    monkeypatch.setattr(search, "use_fts", lambda bind: request.param)
+    return request.param
+
+
+@pytest.fixture
+def journal(
+    backend: bool, db: SQLAlchemy, userdatastore: UserDatastore, user: User
+) -> dict[str, Entry]:
+    other: User = userdatastore.find_user(email="user1@example.test")
+    entries = {
+        "own": Entry(title="Garden notes", content="Tomatoes and basil", user=user),
+        "deleted": Entry(title="Garden plans", content="Tomatoes again", user=user),
+        "shared": Entry(
+            title="Shared garden", content="Tomato soup", user=other, shared_with=[user]
+        ),
+        "private": Entry(title="Other garden", content="Tomatoes", user=other),
+    }
+    db.session.add_all(entries.values())
+    db.session.commit()
+    entries["deleted"].delete()
+    db.session.commit()
+    return entries
+
+
+def search_ids(client: FlaskClient, q: str) -> list[int]:
+    rv = client.get("/api/search", query_string={"q": q})
+    assert rv.status_code == 200
+    assert rv.json["query"] == q
+    return [r["id"] for r in rv.json["results"]]
+
+
+def test_tokenize() -> None:
+    assert search.tokenize("Don't panic, don't_PANIC!") == ["don", "t", "panic"]
+    assert search.tokenize("x" * 100) == ["x" * search.TERM_LENGTH]
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+@pytest.mark.parametrize(
+    ("q", "expected"),
+    [
+        ("tomato", ["shared", "own"]),
+        ("TOMATOES basil", ["own"]),
+        ("soup garden", ["shared"]),
+        ("plans", []),
+        ("", []),
+        ('" OR *', []),
+    ],
+    ids=["prefix", "all-terms", "title", "deleted", "empty", "syntax"],
+)
+def test_search_api(
+    logged_in_user_client: FlaskClient,
+    journal: dict[str, Entry],
+    q: str,
+    expected: list[str],
+) -> None:
+    assert search_ids(logged_in_user_client, q) == [
+        journal[name].id for name in expected
+    ]
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_search_index_updated(
+    logged_in_user_client: FlaskClient, db: SQLAlchemy, journal: dict[str, Entry]
+) -> None:
+    own = journal["own"]
+    own.content = "Cucumbers"
+    db.session.commit()
+    assert search_ids(logged_in_user_client, "basil") == []
+    assert search_ids(logged_in_user_client, "cucumber") == [own.id]
+
+    own_id = own.id
+    own.delete()
+    db.session.commit()
+    assert search_ids(logged_in_user_client, "cucumber") == []
+
+    db.session.scalar(
+        select(Entry).filter_by(id=own_id).execution_options(include_deleted=True)
+    ).undelete()
+    db.session.commit()
+    assert search_ids(logged_in_user_client, "cucumber") == [own_id]
+
+
+@pytest.mark.parametrize("user", ["user3@example.test"], indirect=True)
+def test_search_view(
+    logged_in_user_client: FlaskClient, journal: dict[str, Entry]
+) -> None:
+    rv = logged_in_user_client.get("/search", query_string={"q": "tomato"})
+
+    assert rv.status_code == 200
+    assert "Garden notes" in rv.text
+    assert "Shared garden" in rv.text
+    assert "Other garden" not in rv.text
+    assert '<input type="hidden" name="q" value="tomato">' in rv.text
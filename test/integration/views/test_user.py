@@ -98,7 +98,7 @@ def test_user_view_post_invalid_role(
         assert rv.status_code == 200
         assert html_test_strings["title"] % "View User" in rv.text
         assert html_test_strings["form"]["id"] % 3 in rv.text
-        assert html_test_strings["form"]["error"] % "Invalid Value(s)" in rv.text
+        assert html_test_strings["form"]["error"] % "Invalid Value(s): 6" in rv.text
     else:
         assert rv.status_code == 403
         assert html_test_strings["title"] % "Error" in rv.text
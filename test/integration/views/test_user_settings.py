@@ -1,5 +1,10 @@
+import typing as t
+
 import pytest
+from flask import Flask
 from flask.testing import FlaskClient
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 
 from flask_journal.views.themes import Theme
 
@@ -36,3 +41,33 @@ def test_settings_update_theme(
         assert (
             html_test_strings["settings"]["css"]["bootswatch"] % str(theme) in rv.text
         )
+
+
+def test_settings_cached(
+    app: Flask,
+    logged_in_user_client: FlaskClient,
+    db: SQLAlchemy,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(app.config, "SETTINGS_CACHE_TTL", 60)
+    statements: list[str] = []
+
+    def before_execute(
+        conn: t.Any, cursor: t.Any, statement: str, *args: t.Any
+    ) -> None:
+        statements.append(statement)
+
+    logged_in_user_client.get("/home")
+    event.listen(db.engine, "before_cursor_execute", before_execute)
+    try:
+        rv = logged_in_user_client.get("/home")
+        assert html_test_strings["settings"]["css"]["default"] in rv.text
+        assert not [s for s in statements if "user_settings" in s]
+
+        logged_in_user_client.post(
+            "/settings", data={"Theme": "cyborg", "Update": "Update"}
+        )
+        rv = logged_in_user_client.get("/home")
+        assert html_test_strings["settings"]["css"]["bootswatch"] % "cyborg" in rv.text
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_execute)
@@ -75,8 +75,19 @@ class MockInstAttr:
         return obj in self._shared_with
 
 
+class MockColumn:
+    """Column compared to a bound parameter by the parameter's current value."""
+
+    def __init__(self: t.Self, value: t.Any = None) -> None:
+        self.value = value
+
+    def __eq__(self: t.Self, other: t.Any) -> bool:
+        return self.value == getattr(other, "effective_value", other)
+
+
 class MockModel:
     id: int = None
+    user_id: MockColumn = MockColumn()
     created_at: datetime = None
     deleted_at: datetime = None
     ownable: bool = True
@@ -90,6 +101,12 @@ class MockModel:
         self._shared_users = kwargs.get("shared_with", list())
         self.shared_with._shared_with = self._shared_users
 
+    @classmethod
+    def shared_with_user(cls: t.Self, user_id: t.Any) -> bool:
+        return any(
+            user.id == user_id.effective_value for user in cls.shared_with._shared_with
+        )
+
     def delete(self: t.Self) -> None:
         self.deleted_at = datetime.now()
 
@@ -196,7 +213,9 @@ class MockDB:
         logger.debug("Initialize new MockDB")
         self.session = MockSession()
 
-    def paginate(self: t.Self, select: MockSelect, **kwargs: t.Any) -> MockPagination:
+    def paginate(
+        self: t.Self, select: MockSelect, count: bool = True, **kwargs: t.Any
+    ) -> MockPagination:
         return MockPagination(**kwargs, _items=select._items)
 
 
@@ -41,6 +41,7 @@ def mock_db(monkeypatch: pytest.MonkeyPatch) -> None:
     db = MockDB()
     monkeypatch.setattr(views.base, "db", db)
     monkeypatch.setattr(views.tag, "db", db)
+    monkeypatch.setattr(views.counts, "set_total", lambda *args, **kwargs: None)
 
 
 @pytest.fixture
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import pytest
+
+from flask_journal.models import Entry, Tag, User
+from flask_journal.views import pagination
+
+
+@pytest.mark.parametrize(
+    "values",
+    [(1,), (datetime(2024, 4, 18, 10, 58, 39), 5)],
+    ids=["id", "created_at"],
+)
+def test_cursor_round_trip(values: tuple) -> None:
+    keys = [Entry.id] if len(values) == 1 else [Entry.created_at, Entry.id]
+    token = pagination.encode_cursor(values)
+
+    assert "=" not in token
+    assert pagination.decode_cursor(token, keys) == values
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not a cursor",
+        pagination.encode_cursor([1, 2]),
+        pagination.encode_cursor(["a"]),
+        "W0luZmluaXR5XQ",
+        pagination.encode_cursor([2**63]),
+    ],
+    ids=["garbage", "wrong-length", "wrong-type", "infinity", "overflow"],
+)
+def test_cursor_invalid(token: str) -> None:
+    with pytest.raises(ValueError):
+        pagination.decode_cursor(token, [Entry.id])
+
+
+@pytest.mark.parametrize(
+    ("model", "order_field", "expected"),
+    [
+        (Entry, "created_at", ("created_at", "id")),
+        (Entry, "id", ("id",)),
+        (Entry, None, ("id",)),
+        (Entry, "title", ("id",)),
+        (Tag, "name", ("name", "id")),
+        (User, "name", ("id",)),
+        (User, "invalid", ("id",)),
+    ],
+    ids=["column", "id", "none", "hybrid", "string", "nullable", "invalid"],
+)
+def test_key_fields(model: type, order_field: str | None, expected: tuple) -> None:
+    assert pagination.key_fields(model, order_field) == expected
@@ -1,10 +1,13 @@
 import pytest
 import wtforms
 from flask import Flask
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 from werkzeug.exceptions import HTTPException
 
 from flask_journal.forms.base import CustomForm
-from flask_journal.models import User
+from flask_journal.models import Entry, Tag, User
+from flask_journal.security.utils import current_user_id
 from flask_journal.views import utils as view_utils
 
 from . import MockModel
@@ -69,7 +72,8 @@ def test_build_select_user_no_filters(
 ) -> None:
     r_select = view_utils.build_select(model_class)
 
-    assert r_select.filter == dict(user=user)
+    assert r_select.filter == dict(user_id=current_user_id)
+    assert current_user_id.effective_value == user.id
     assert not r_select.include_deleted
 
 
@@ -88,7 +92,7 @@ def test_build_select_user_filters(
 ) -> None:
     r_select = view_utils.build_select(model_class, filters={"id": 1})
 
-    assert r_select.filter == dict(user=user, id=1)
+    assert r_select.filter == dict(user_id=current_user_id, id=1)
     assert not r_select.include_deleted
 
 
@@ -177,4 +181,46 @@ def test_build_select_not_shared(
     )
     r_select = view_utils.build_select(model_class, shared=False)
     assert r_select.where_exp is False
-    assert r_select.filter == dict(user=user)
+    assert r_select.filter == dict(user_id=current_user_id)
+
+
+@pytest.mark.parametrize(
+    ("model", "fields", "included", "excluded"),
+    [
+        (Entry, ["id", "title", "created_at"], ["_title", "storage"], ["_data"]),
+        (Entry, ["content"], ["_data", "storage"], ["_title", "created_at"]),
+        (Entry, ["user", "invalid"], ["user_id", "deleted_at"], ["_data"]),
+        (Tag, ["name"], ["name"], ["created_at", "user_id"]),
+    ],
+    ids=["hybrid", "content", "relationship", "column"],
+)
+def test_loader_options(
+    model: type, fields: list[str], included: list[str], excluded: list[str]
+) -> None:
+    options = view_utils.loader_options(model, fields)
+    sql = str(select(model).options(*options).compile())
+    table = model.__tablename__
+
+    for column in included:
+        assert f"{table}.{column}" in sql
+    for column in excluded:
+        assert f"{table}.{column}" not in sql
+    if "user" in fields:
+        assert 'LEFT OUTER JOIN "user"' in sql
+
+
+@pytest.mark.parametrize(
+    ("loaders", "joined"),
+    [(None, True), ({"user": selectinload}, False)],
+    ids=["default", "override"],
+)
+def test_loader_options_loaders(loaders: dict | None, joined: bool) -> None:
+    options = view_utils.loader_options(Entry, ["user", "tag_names"], loaders)
+    sql = str(select(Entry).options(*options).compile())
+
+    assert ('JOIN "user"' in sql) is joined
+    assert "entry_tags.entry_id = entry.id" in sql
+
+
+def test_loader_options_unmapped() -> None:
+    assert view_utils.loader_options(MockModel, ["id"]) == []